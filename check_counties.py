@@ -1,17 +1,13 @@
-import json
+from ky_data import COUNTY_GEOJSON, iter_contest_results, load_election_data, load_json
 
 # Load election results
-with open('data/ky_election_results.json') as f:
-    data = json.load(f)
+data = load_election_data()
 
 # Extract all unique county names from election data
 counties = set()
-for year in data['results_by_year'].values():
-    for office in year.values():
-        for contest in office.values():
-            # Counties are in the 'results' key
-            for county in contest.get('results', {}).keys():
-                counties.add(county)
+for _, _, _, contest_results in iter_contest_results(data):
+    # Counties are in the 'results' key
+    counties.update(contest_results.keys())
 
 print(f"Found {len(counties)} counties in election data")
 print("\nFirst 10 counties:")
@@ -19,8 +15,7 @@ for county in sorted(list(counties))[:10]:
     print(f"  - {county}")
 
 # Load GeoJSON to check county names there
-with open('data/tl_2020_21_county20/tl_2020_21_county20.geojson') as f:
-    geojson = json.load(f)
+geojson = load_json(COUNTY_GEOJSON)
 
 geojson_counties = set()
 for feature in geojson['features']:
@@ -1,10 +1,7 @@
-import json
-
-with open('data/ky_election_results.json') as f:
-    data = json.load(f)
+from ky_data import ELECTION_JSON, load_json_subtree
 
 # Check 2024 structure
-year_2024 = data['results_by_year']['2024']
+year_2024 = load_json_subtree(ELECTION_JSON, 'results_by_year.2024')
 print("2024 keys:", list(year_2024.keys()))
 
 # Get first office type
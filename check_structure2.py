@@ -1,12 +1,7 @@
-import json
-
-with open('data/ky_election_results.json') as f:
-    data = json.load(f)
+from ky_data import ELECTION_JSON, load_json_subtree
 
 # Check 2024 structure
-year_2024 = data['results_by_year']['2024']
-contest = year_2024['President']['President']
-results = contest['results']
+results = load_json_subtree(ELECTION_JSON, 'results_by_year.2024.President.President.results')
 
 print("Keys in 'results':", list(results.keys())[:5])
 
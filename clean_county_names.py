@@ -1,4 +1,4 @@
-import json
+from ky_data import ELECTION_JSON, rewrite_result_keys
 
 # Mapping of bad county names to correct Kentucky county names
 COUNTY_MAPPING = {
@@ -41,35 +41,19 @@ COUNTY_MAPPING = {
 }
 
 print("Loading election data...")
-with open('data/ky_election_results.json') as f:
-    data = json.load(f)
+with open(ELECTION_JSON, encoding='utf-8', newline='') as f:
+    text = f.read()
 
-# Counter for changes
-changes = 0
-
-# Process each year/office/contest
-for year in data['results_by_year'].values():
-    for office in year.values():
-        for contest in office.values():
-            if 'results' in contest:
-                results = contest['results']
-                
-                # Check for counties that need mapping
-                bad_counties = [k for k in results.keys() if k in COUNTY_MAPPING]
-                
-                for bad_name in bad_counties:
-                    good_name = COUNTY_MAPPING[bad_name]
-                    
-                    # Move the data
-                    results[good_name] = results.pop(bad_name)
-                    changes += 1
+# Rename the county keys of each contest's results
+# directly in the JSON text instead of parsing and re-serializing the whole file
+text, changes, _ = rewrite_result_keys(text, COUNTY_MAPPING)
 
 print(f"Fixed {changes} county name references")
 
 # Save corrected data
 print("Saving corrected election data...")
-with open('data/ky_election_results.json', 'w') as f:
-    json.dump(data, f)
+with open(ELECTION_JSON, 'w', encoding='utf-8', newline='') as f:
+    f.write(text)
 
 print("\n✓ Election JSON cleaned and saved")
 print(f"  - All county names now match Kentucky GeoJSON (120 counties)")
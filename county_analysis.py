@@ -4,130 +4,81 @@ Generate county-specific data cards with actual election metrics
 Pulls real numbers from election JSON to create data-driven analysis
 """
 
-import json
-from statistics import mean, stdev
-from collections import defaultdict
-
-# Load election data
-with open('data/ky_election_results.json', 'r') as f:
-    election_data = json.load(f)
-
-results = election_data['results_by_year']
+import heapq
+from statistics import fmean, stdev
+from collections import Counter, defaultdict
+
+from ky_data import iter_county_margins
+
+# Index margins, winners, and earliest/latest-year margins by county in a
+# single pass over the county results. Within a year the first contest seen wins.
+county_margins = defaultdict(list)
+county_winners = defaultdict(Counter)
+county_first = {}
+county_last = {}
+for year, county, margin, winner in iter_county_margins():
+    county_margins[county].append(abs(margin))
+    county_winners[county][winner] += 1
+
+    first = county_first.get(county)
+    if first is None or year < first[0]:
+        county_first[county] = (year, margin)
+    last = county_last.get(county)
+    if last is None or year > last[0]:
+        county_last[county] = (year, margin)
+
+ALL_COUNTIES = frozenset(county_margins)
 
 def get_county_metrics(county_name):
     """Get voting metrics for a county across all years"""
-    margins = []
-    winners = defaultdict(int)
-    
-    for year in sorted(results.keys()):
-        for office in results[year].values():
-            for contest in office.values():
-                if 'results' in contest and county_name in contest['results']:
-                    county_data = contest['results'][county_name]
-                    margin = county_data.get('margin_pct', 0)
-                    winner = county_data.get('winner', 'UNKNOWN')
-                    margins.append(abs(margin))
-                    winners[winner] += 1
+    margins = county_margins.get(county_name)
     
     if not margins:
         return None
     
     return {
-        'avg_margin': mean(margins),
+        'avg_margin': fmean(margins),
         'max_margin': max(margins),
-        'winners': dict(winners),
+        'winners': dict(county_winners[county_name]),
     }
 
 def get_top_republican_counties(n=5):
     """Get counties with highest Republican average margins"""
-    county_metrics = {}
-    
-    all_counties = set()
-    for year in results.values():
-        for office in year.values():
-            for contest in office.values():
-                if 'results' in contest:
-                    all_counties.update(contest['results'].keys())
-    
-    for county in all_counties:
-        metrics = get_county_metrics(county)
-        if metrics:
-            county_metrics[county] = metrics['avg_margin']
+    county_metrics = (
+        (county, fmean(margins))
+        for county, margins in county_margins.items()
+        if margins
+    )
     
-    sorted_counties = sorted(county_metrics.items(), key=lambda x: x[1], reverse=True)
-    return sorted_counties[:n]
+    return heapq.nlargest(n, county_metrics, key=lambda x: x[1])
 
 def get_top_democratic_counties(n=5):
     """Get counties with highest Democratic average margins"""
-    county_metrics = {}
-    
-    all_counties = set()
-    for year in results.values():
-        for office in year.values():
-            for contest in office.values():
-                if 'results' in contest:
-                    all_counties.update(contest['results'].keys())
-    
-    for county in all_counties:
-        metrics = get_county_metrics(county)
-        if metrics:
-            county_metrics[county] = metrics['avg_margin']
-    
     # Get counties with DEM wins
-    dem_counties = {}
-    for year in results.values():
-        for office in year.values():
-            for contest in office.values():
-                if 'results' in contest:
-                    for county, data in contest['results'].items():
-                        if data.get('winner') == 'DEM':
-                            if county not in dem_counties:
-                                dem_counties[county] = 0
-                            dem_counties[county] += 1
+    dem_counties = (
+        (county, winners['DEM'])
+        for county, winners in county_winners.items()
+        if winners['DEM']
+    )
     
-    sorted_counties = sorted(dem_counties.items(), key=lambda x: x[1], reverse=True)
-    return sorted_counties[:n]
+    return heapq.nlargest(n, dem_counties, key=lambda x: x[1])
 
 def get_county_swing(county_name):
     """Get swing change in a county from first to last year"""
-    first_year_margin = None
-    last_year_margin = None
-    
-    years = sorted(results.keys())
-    
-    # Get first year
-    for year in years:
-        for office in results[year].values():
-            for contest in office.values():
-                if 'results' in contest and county_name in contest['results']:
-                    if first_year_margin is None:
-                        data = contest['results'][county_name]
-                        first_year_margin = data.get('margin_pct', 0)
-                        first_year = year
-                    break
-    
-    # Get last year
-    for year in reversed(years):
-        for office in results[year].values():
-            for contest in office.values():
-                if 'results' in contest and county_name in contest['results']:
-                    if last_year_margin is None:
-                        data = contest['results'][county_name]
-                        last_year_margin = data.get('margin_pct', 0)
-                        last_year = year
-                    break
-    
-    if first_year_margin is not None and last_year_margin is not None:
-        swing = last_year_margin - first_year_margin
-        return {
-            'first_year': first_year,
-            'first_margin': first_year_margin,
-            'last_year': last_year,
-            'last_margin': last_year_margin,
-            'swing': swing,
-        }
+    if county_name not in county_first:
+        return None
+
+    first_year, first_year_margin = county_first[county_name]
+    last_year, last_year_margin = county_last[county_name]
     
-    return None
+    swing = last_year_margin - first_year_margin
+    return {
+        'first_year': first_year,
+        'first_margin': first_year_margin,
+        'last_year': last_year,
+        'last_margin': last_year_margin,
+        'swing': swing,
+    }
 
 # Generate analysis
 print("=" * 80)
@@ -152,15 +103,8 @@ for i, (county, wins) in enumerate(dem_counties, 1):
 print("\n📊 BIGGEST RIGHTWARD SHIFTS (2000-2024)")
 print("-" * 80)
 
-all_counties = set()
-for year in results.values():
-    for office in year.values():
-        for contest in office.values():
-            if 'results' in contest:
-                all_counties.update(contest['results'].keys())
-
 swings = []
-for county in all_counties:
+for county in ALL_COUNTIES:
     swing_data = get_county_swing(county)
     if swing_data:
         swings.append((county, swing_data['swing']))
@@ -1,15 +1,29 @@
-import json
 import copy
+import gzip
+import os
+
+from ky_data import COUNTY_GEOJSON, dumps_json, iter_contest_results, load_election_data, load_json
+
+# Fields copied into each county feature, with the default used when a result lacks one
+RESULT_FIELDS = {
+    'contest_name': None,
+    'dem_votes': 0,
+    'rep_votes': 0,
+    'other_votes': 0,
+    'total_votes': 0,
+    'winner': None,
+    'margin': None,
+    'margin_pct': None,
+    'competitiveness': None,
+}
 
 # Load Kentucky GeoJSON
 print("Loading Kentucky GeoJSON...")
-with open('data/tl_2020_21_county20/tl_2020_21_county20.geojson') as f:
-    geojson = json.load(f)
+geojson = load_json(COUNTY_GEOJSON)
 
 # Load election data
 print("Loading election results...")
-with open('data/ky_election_results.json') as f:
-    election_data = json.load(f)
+election_data = load_election_data()
 
 # Create a mapping of valid Kentucky counties (from GeoJSON)
 valid_counties = {}
@@ -23,34 +37,28 @@ print(f"Found {len(valid_counties)} Kentucky counties")
 # Merge election data into each county feature
 print("Merging election data...")
 
+# Bucket every county result by county in one walk of the election tree
+years = list(election_data['results_by_year'])
+elections_by_county = {
+    county_name: {year: {} for year in years} for county_name in valid_counties
+}
+
+for year, office_name, contest_key, contest_results in iter_contest_results(election_data):
+    contest_id = f"{office_name}_{contest_key}"
+    for county_name, county_result in contest_results.items():
+        county_elections = elections_by_county.get(county_name)
+        if county_elections is None:
+            continue
+
+        # Store the result
+        county_elections[year][contest_id] = {
+            field: county_result.get(field, default)
+            for field, default in RESULT_FIELDS.items()
+        }
+
+# Add elections to feature properties
 for county_name, feature in valid_counties.items():
-    county_elections = {}
-    
-    # Extract election results for this county across all years
-    for year, offices in election_data['results_by_year'].items():
-        county_elections[year] = {}
-        
-        for office_name, contests in offices.items():
-            for contest_key, contest in contests.items():
-                # Get results for this county if it exists
-                if 'results' in contest and county_name in contest['results']:
-                    county_result = contest['results'][county_name]
-                    
-                    # Store the result  
-                    contest_id = f"{office_name}_{contest_key}"
-                    county_elections[year][contest_id] = {
-                        'contest_name': county_result.get('contest_name'),
-                        'dem_votes': county_result.get('dem_votes', 0),
-                        'rep_votes': county_result.get('rep_votes', 0),
-                        'other_votes': county_result.get('other_votes', 0),
-                        'total_votes': county_result.get('total_votes', 0),
-                        'winner': county_result.get('winner'),
-                        'margin': county_result.get('margin'),
-                        'margin_pct': county_result.get('margin_pct'),
-                        'competitiveness': county_result.get('competitiveness'),
-                    }
-    
-    # Add elections to feature properties
+    county_elections = elections_by_county[county_name]
     if county_elections:
         feature['properties']['elections'] = county_elections
 
@@ -59,10 +67,17 @@ print(f"Merged election data into {len(valid_counties)} features")
 # Save the merged GeoJSON
 output_path = 'data/kentucky_counties.geojson'
 print(f"Saving to {output_path}...")
-with open(output_path, 'w') as f:
-    json.dump(geojson, f)
+buf = dumps_json(geojson)
+with open(output_path, 'wb') as f:
+    f.write(buf)
+
+# Gzipped copy for serving; level 1 is fast and still shrinks the coordinate text several-fold
+gz_path = output_path + '.gz'
+with gzip.open(gz_path, 'wb', compresslevel=1) as f:
+    f.write(buf)
 
 print(f"✓ Merged GeoJSON saved successfully")
 print(f"  - Counties: {len(geojson['features'])}")
 print(f"  - Years available: 2000, 2002-2004, 2007-2008, 2012-2024")
-print(f"  - File size: {len(json.dumps(geojson)) / 1024 / 1024:.2f} MB")
+print(f"  - File size: {os.path.getsize(output_path) / 1024 / 1024:.2f} MB")
+print(f"  - Gzipped size: {os.path.getsize(gz_path) / 1024 / 1024:.2f} MB ({gz_path})")
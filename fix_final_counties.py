@@ -1,37 +1,20 @@
-import json
+from ky_data import ELECTION_JSON, rewrite_result_keys
 
 print("Loading election data...")
-with open('data/ky_election_results.json') as f:
-    data = json.load(f)
+with open(ELECTION_JSON, encoding='utf-8', newline='') as f:
+    text = f.read()
 
-# Counter for changes
-changes = 0
-removed_allegany = 0
-
-# Process each year/office/contest
-for year in data['results_by_year'].values():
-    for office in year.values():
-        for contest in office.values():
-            if 'results' in contest:
-                results = contest['results']
-                
-                # Fix Breckenridge -> Breckinridge
-                if 'Breckenridge' in results:
-                    results['Breckinridge'] = results.pop('Breckenridge')
-                    changes += 1
-                
-                # Remove Allegany (not a valid KY county)
-                if 'Allegany' in results:
-                    results.pop('Allegany')
-                    removed_allegany += 1
+# Fix Breckenridge -> Breckinridge and remove Allegany (not a valid KY county)
+# in one pass over the text
+text, changes, removed_allegany = rewrite_result_keys(text, {'Breckenridge': 'Breckinridge'}, remove=['Allegany'])
 
 print(f"Fixed Breckenridge spelling: {changes} times")
 print(f"Removed invalid Allegany county: {removed_allegany} times")
 
 # Save corrected data
 print("Saving corrected election data...")
-with open('data/ky_election_results.json', 'w') as f:
-    json.dump(data, f)
+with open(ELECTION_JSON, 'w', encoding='utf-8', newline='') as f:
+    f.write(text)
 
 print("\n✓ Election JSON finalized")
 print(f"  - All county names now match Kentucky GeoJSON (120 counties)")
@@ -7,6 +7,10 @@ Validates all data, generates metrics, and creates comprehensive report
 import json
 import re
 
+from ky_data import COUNTY_GEOJSON, count_literals, iter_contest_results, load_election_data, load_json
+
+OHIO_RE = re.compile(r'Ohio\b')
+
 print("=" * 80)
 print("KENTUCKY POLITICAL REALIGNMENT MAP - INTEGRATION SUMMARY")
 print("=" * 80)
@@ -15,8 +19,7 @@ print("=" * 80)
 print("\n✓ ELECTION DATA VALIDATION")
 print("-" * 80)
 
-with open('data/ky_election_results.json', 'r') as f:
-    election_data = json.load(f)
+election_data = load_election_data()
 
 results = election_data['results_by_year']
 years = sorted(results.keys())
@@ -25,11 +28,8 @@ print(f"  Total years: {len(years)}")
 
 # Count counties
 all_counties = set()
-for year in results.values():
-    for office in year.values():
-        for contest in office.values():
-            if 'results' in contest:
-                all_counties.update(contest['results'].keys())
+for _, _, _, contest_results in iter_contest_results(election_data):
+    all_counties.update(contest_results.keys())
 
 print(f"  Total counties: {len(all_counties)}")
 print(f"  Counties: {', '.join(sorted(list(all_counties))[:10])}... (showing first 10)")
@@ -38,8 +38,7 @@ print(f"  Counties: {', '.join(sorted(list(all_counties))[:10])}... (showing fir
 print("\n✓ GEOJSON VALIDATION")
 print("-" * 80)
 
-with open('data/tl_2020_21_county20/tl_2020_21_county20.geojson', 'r') as f:
-    geojson_data = json.load(f)
+geojson_data = load_json(COUNTY_GEOJSON)
 
 geojson_counties = set()
 for feature in geojson_data['features']:
@@ -78,50 +77,61 @@ print("-" * 80)
 with open('index.html', 'r', encoding='utf-8') as f:
     html_content = f.read()
 
+topics = [
+    ('Republican Lean', 'Kentucky\'s Republican Lean'),
+    ('Urban-Rural Divide', 'Jefferson and Fayette vs. Eastern'),
+    ('Appalachian Politics', 'Appalachian Kentucky'),
+    ('Swing Counties', 'Kentucky\'s Swing Counties'),
+    ('Senate Races', 'Senate Races'),
+    ('Congressional Representation', 'Democratic Decline'),
+    ('Demographics', 'Demographics and The Future'),
+    ('Electoral Reality', 'Electoral Reality'),
+]
+
+# Count every fixed-string probe in one sweep of the page
+found = count_literals(html_content, [
+    './data/ky_election_results.json',
+    'data/ky_election_results.json',
+    'tl_2020_21_county20/tl_2020_21_county20.geojson',
+    'tl_2020_21_county20',
+    'Kentucky Political Realignment Map',
+    '<div class="finding-card">',
+    *(search_term for _, search_term in topics),
+])
+
 # Check for Kentucky paths
-if './data/ky_election_results.json' in html_content:
+if found['./data/ky_election_results.json']:
     print("  ✓ Kentucky election JSON path configured")
 else:
     print("  ✗ Kentucky election JSON path NOT found")
 
-if 'tl_2020_21_county20/tl_2020_21_county20.geojson' in html_content:
+if found['tl_2020_21_county20/tl_2020_21_county20.geojson']:
     print("  ✓ Kentucky GeoJSON path configured")
 else:
     print("  ✗ Kentucky GeoJSON path NOT found")
 
-if 'Kentucky Political Realignment Map' in html_content:
+if found['Kentucky Political Realignment Map']:
     print("  ✓ Kentucky title configured")
 else:
     print("  ✗ Kentucky title NOT found")
 
 # Check for Ohio references (should be gone)
-ohio_refs = len(re.findall(r'\bOhio\b|\bOhio\b|Ohio\b', html_content))
+ohio_refs = len(OHIO_RE.findall(html_content))
 if ohio_refs == 0:
     print("  ✓ No Ohio references found")
 else:
     print(f"  ⚠  Found {ohio_refs} Ohio reference(s)")
 
 # Count research finding cards
-finding_cards = len(re.findall(r'<div class="finding-card">', html_content))
+finding_cards = found['<div class="finding-card">']
 print(f"  ✓ Research finding cards: {finding_cards} cards (expected 9)")
 
 # 5. Kentucky-specific topics covered
 print("\n✓ KENTUCKY-SPECIFIC ANALYSIS COVERAGE")
 print("-" * 80)
 
-topics = [
-    ('Republican Lean', 'Kentucky\'s Republican Lean'),
-    ('Urban-Rural Divide', 'Jefferson and Fayette vs. Eastern'),
-    ('Appalachian Politics', 'Appalachian Kentucky'),
-    ('Swing Counties', 'Kentucky\'s Swing Counties'),
-    ('Senate Races', 'Senate Races'),
-    ('Congressional Representation', 'Democratic Decline'),
-    ('Demographics', 'Demographics and The Future'),
-    ('Electoral Reality', 'Electoral Reality'),
-]
-
 for topic_name, search_term in topics:
-    if search_term in html_content:
+    if found[search_term]:
         print(f"  ✓ {topic_name}")
     else:
         print(f"  ✗ {topic_name}")
@@ -146,8 +156,8 @@ print("-" * 80)
 checklist = [
     ('Data files in place', 
      all([
-         'data/ky_election_results.json' in html_content,
-         'tl_2020_21_county20' in html_content,
+         found['data/ky_election_results.json'],
+         found['tl_2020_21_county20'],
      ])),
     ('All 120 counties matched',
      len(matching) == 120),
@@ -156,7 +166,7 @@ checklist = [
     ('9 research finding cards',
      finding_cards == 9),
     ('Kentucky title & metadata',
-     'Kentucky Political Realignment Map' in html_content),
+     found['Kentucky Political Realignment Map'] > 0),
     ('County validation passing',
      len(matching) == 120 and len(missing_geo) == 0 and len(missing_elec) == 0),
 ]
@@ -0,0 +1,272 @@
+"""
+Shared JSON helpers for the Kentucky election data scripts.
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+import json
+import os
+import pickle
+import re
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_DECODER = json.JSONDecoder()
+
+ELECTION_JSON = 'data/ky_election_results.json'
+ELECTION_CACHE = 'data/ky_election_results.cache.pkl'
+COUNTY_GEOJSON = 'data/tl_2020_21_county20/tl_2020_21_county20.geojson'
+
+
+def load_json(path):
+    """Load a JSON file, parsing the raw bytes with orjson when available"""
+    with open(path, 'rb') as f:
+        buf = f.read()
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def dumps_json(data):
+    """Serialize data to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def dump_json(data, path):
+    """Write data as compact JSON, serializing with orjson when available"""
+    buf = dumps_json(data)
+    with open(path, 'wb') as f:
+        f.write(buf)
+    return len(buf)
+
+
+if msgspec is not None:
+    class CountyMargin(msgspec.Struct):
+        """The per-county fields read by the margin analyses; everything else is skipped"""
+        margin_pct: float | None = None
+        winner: str | None = None
+
+    class ContestMargins(msgspec.Struct):
+        results: dict[str, CountyMargin] = {}
+
+    class ElectionMargins(msgspec.Struct):
+        results_by_year: dict[str, dict[str, dict[str, ContestMargins]]]
+
+
+def load_json_subtree(path, prefix):
+    """Load only the value at a dotted key prefix, streaming with ijson when available"""
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            for value in ijson.items(f, prefix, use_float=True):
+                return value
+        raise KeyError(prefix)
+
+    data = load_json(path)
+    for key in prefix.split('.'):
+        data = data[key]
+    return data
+
+
+def load_election_data(path=ELECTION_JSON, cache_path=ELECTION_CACHE):
+    """
+    Load the election JSON, reusing a pickle sidecar while it is newer than the JSON.
+    Within one process the parsed data is shared until the JSON changes on disk,
+    so callers must treat it as read-only.
+    """
+    return _load_election_data(path, cache_path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _load_election_data(path, cache_path, mtime_ns):
+    try:
+        if os.path.getmtime(cache_path) > os.path.getmtime(path):
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    data = load_json(path)
+    try:
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return data
+
+
+def iter_contest_results(data):
+    """Yield (year, office_name, contest_key, results) for every contest with county results"""
+    for year, offices in data['results_by_year'].items():
+        for office_name, contests in offices.items():
+            for contest_key, contest in contests.items():
+                if 'results' in contest:
+                    yield year, office_name, contest_key, contest['results']
+
+
+_RESULTS_OBJECT_RE = re.compile(r'"results"\s*:\s*(?=\{)')
+
+
+def _skip_whitespace(text, pos):
+    while pos < len(text) and text[pos] in ' \t\r\n':
+        pos += 1
+    return pos
+
+
+def _object_members(text, pos):
+    """
+    Walk the JSON object whose '{' is at text[pos].
+    Returns ([(key, start, key_end, end), ...], object_end) with each member's text span.
+    """
+    members = []
+    pos = _skip_whitespace(text, pos + 1)
+    if text[pos] == '}':
+        return members, pos + 1
+    while True:
+        start = pos
+        key, key_end = _DECODER.raw_decode(text, pos)
+        pos = _skip_whitespace(text, _skip_whitespace(text, key_end) + 1)
+        _, pos = _DECODER.raw_decode(text, pos)
+        members.append((key, start, key_end, pos))
+        pos = _skip_whitespace(text, pos)
+        if text[pos] == '}':
+            return members, pos + 1
+        pos = _skip_whitespace(text, pos + 1)
+
+
+def _key_hits(text, names):
+    """Yield the offset of every quoted name followed by a colon, in order, in one Aho-Corasick pass when available"""
+    if ahocorasick is None:
+        pattern = re.compile('(?:' + '|'.join(re.escape(json.dumps(name)) for name in names) + r')(?=\s*:)')
+        for m in pattern.finditer(text):
+            yield m.start()
+        return
+
+    automaton = ahocorasick.Automaton()
+    for name in names:
+        quoted = json.dumps(name)
+        automaton.add_word(quoted, len(quoted))
+    automaton.make_automaton()
+
+    # Hits come back by end offset; skip the ones used as values rather than keys
+    for end, length in automaton.iter(text):
+        after = _skip_whitespace(text, end + 1)
+        if after < len(text) and text[after] == ':':
+            yield end + 1 - length
+
+
+def rewrite_result_keys(text, mapping, remove=()):
+    """
+    Rename and remove county keys in the contests' results objects of raw election JSON.
+    A single scan finds the keys; only the results objects holding one are walked and rewritten,
+    applying results[new] = results.pop(old) in key order and then removing the keys in remove.
+    Returns (text, renamed, removed).
+    """
+    if not mapping and not remove:
+        return text, 0, 0
+
+    object_starts = None
+    pieces = []
+    pos = 0
+    object_end = 0
+    renamed = 0
+    removed = 0
+    for hit in _key_hits(text, [*mapping, *remove]):
+        if hit < object_end:
+            continue
+        if object_starts is None:
+            object_starts = [m.end() for m in _RESULTS_OBJECT_RE.finditer(text)]
+        i = bisect_right(object_starts, hit) - 1
+        if i < 0:
+            continue
+        members, end = _object_members(text, object_starts[i])
+        if hit >= end or not members:
+            continue
+        object_end = end
+
+        # Each member's text after its key, so renamed entries keep their original formatting
+        values = {key: text[key_end:member_end] for key, _, key_end, member_end in members}
+        bad_keys = [key for key in values if key in mapping]
+        for key in bad_keys:
+            values[mapping[key]] = values.pop(key)
+        gone = [key for key in remove if key in values]
+        for key in gone:
+            del values[key]
+        if not bad_keys and not gone:
+            continue
+        renamed += len(bad_keys)
+        removed += len(gone)
+
+        separator = text[members[0][3]:members[1][1]] if len(members) > 1 else ', '
+        pieces.append(text[pos:members[0][1]])
+        pieces.append(separator.join(json.dumps(key) + value for key, value in values.items()))
+        pos = members[-1][3]
+
+    pieces.append(text[pos:])
+    return ''.join(pieces), renamed, removed
+
+
+def count_literals(text, literals):
+    """Count occurrences of each literal in text, in a single Aho-Corasick pass when available"""
+    literals = set(literals)
+    if ahocorasick is None:
+        return Counter({literal: text.count(literal) for literal in literals})
+
+    automaton = ahocorasick.Automaton()
+    for literal in literals:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+
+    found = Counter()
+    for _, literal in automaton.iter(text):
+        found[literal] += 1
+    return found
+
+
+def _margin_defaults(margin_pct, winner):
+    # Missing and null fields both fall back to an even margin with no known winner
+    return (0 if margin_pct is None else margin_pct), ('UNKNOWN' if winner is None else winner)
+
+
+def iter_county_margins(path=ELECTION_JSON):
+    """
+    Yield (year, county, margin_pct, winner) for every county result.
+    With msgspec installed the JSON is decoded straight into slotted structs holding
+    only these two fields; otherwise the full election data is loaded.
+    """
+    if msgspec is None:
+        for year, _, _, contest_results in iter_contest_results(load_election_data(path)):
+            for county, county_data in contest_results.items():
+                yield year, county, *_margin_defaults(county_data.get('margin_pct'), county_data.get('winner'))
+        return
+
+    with open(path, 'rb') as f:
+        data = msgspec.json.decode(f.read(), type=ElectionMargins)
+    for year, offices in data.results_by_year.items():
+        for contests in offices.values():
+            for contest in contests.values():
+                for county, county_data in contest.results.items():
+                    yield year, county, *_margin_defaults(county_data.margin_pct, county_data.winner)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Run several of the root data scripts in one Python process
+The election JSON is parsed once and shared by every step that reads it
+
+Usage:
+    python pipeline.py check clean merge summary
+"""
+
+import argparse
+import runpy
+
+STEPS = {
+    'check': ['check_counties.py'],
+    'validate': ['validate_counties.py'],
+    'clean': ['clean_county_names.py', 'fix_final_counties.py'],
+    'merge': ['create_merged_geojson.py'],
+    'analysis': ['county_analysis.py'],
+    'summary': ['integration_summary.py'],
+}
+
+parser = argparse.ArgumentParser(description="Run Kentucky data scripts in one process")
+parser.add_argument('steps', nargs='+', choices=list(STEPS), help="Steps to run, in order")
+args = parser.parse_args()
+
+for step in args.steps:
+    for script in STEPS[step]:
+        print(f"\n>>> {step}: {script}")
+        runpy.run_path(script, run_name='__main__')
@@ -1,11 +1,25 @@
 """
 Manually add missing counties to 2010 Senate extraction.
 Missing: Caldwell, Casey, Greenup, Harlan, Woodford
+
+Usage:
+    python scripts/add_missing_2010.py [--votes-file votes.json]
+
+Without --votes-file, vote counts are prompted for interactively.
 """
 
+import argparse
+import json
 import pandas as pd
 from pathlib import Path
 
+parser = argparse.ArgumentParser(description="Add missing 2010 US Senate county results")
+parser.add_argument(
+    "--votes-file",
+    help='JSON file mapping county to [Paul, Conway, Wilson] votes, e.g. {"Caldwell": [5280, 3145, 12]}',
+)
+args = parser.parse_args()
+
 # Load existing data
 csv_path = Path('data/20101102__ky__general__senate__county.csv')
 df = pd.read_csv(csv_path)
@@ -26,53 +40,69 @@ candidates = [
     {'name': 'Billy Ray Wilson', 'party': 'WI'}
 ]
 
-print("\n" + "="*70)
-print("Enter vote counts for each county")
-print("="*70)
-print("Format: RandPaul JackConway BillyRayWilson (space-separated)")
-print("Example: 5280 3145 12")
-print("(Press Enter to skip a county)\n")
 
-new_rows = []
+def candidate_rows(county, votes):
+    """Build one OpenElections row per candidate for a county"""
+    return [
+        {
+            'county': county,
+            'office': 'U.S. Senate',
+            'district': '',
+            'candidate': cand_info['name'],
+            'party': cand_info['party'],
+            'votes': vote_count,
+            'election_day': '',
+            'absentee': '',
+            'av_counting_boards': '',
+            'early_voting': '',
+            'mail': '',
+            'provisional': '',
+            'pre_process_absentee': ''
+        }
+        for cand_info, vote_count in zip(candidates, votes)
+    ]
 
-for county in missing_counties:
-    votes_input = input(f"{county}: ").strip()
-    
-    if not votes_input:
-        print(f"  Skipped {county}")
-        continue
-    
-    try:
-        votes = [int(v.replace(',', '')) for v in votes_input.split()]
-        
-        if len(votes) != 3:
-            print(f"  ⚠ Error: Need 3 values, got {len(votes)}. Skipping.")
+
+def prompt_votes():
+    """Read vote counts for each missing county from the terminal"""
+    print("\n" + "="*70)
+    print("Enter vote counts for each county")
+    print("="*70)
+    print("Format: RandPaul JackConway BillyRayWilson (space-separated)")
+    print("Example: 5280 3145 12")
+    print("(Press Enter to skip a county)\n")
+
+    batch = {}
+    for county in missing_counties:
+        votes_input = input(f"{county}: ").strip()
+
+        if not votes_input:
+            print(f"  Skipped {county}")
             continue
-        
-        # Add rows for each candidate
-        for i, cand_info in enumerate(candidates):
-            new_rows.append({
-                'county': county,
-                'office': 'U.S. Senate',
-                'district': '',
-                'candidate': cand_info['name'],
-                'party': cand_info['party'],
-                'votes': votes[i],
-                'election_day': '',
-                'absentee': '',
-                'av_counting_boards': '',
-                'early_voting': '',
-                'mail': '',
-                'provisional': '',
-                'pre_process_absentee': ''
-            })
-        
-        print(f"  ✓ Added {county}: Paul={votes[0]:,}, Conway={votes[1]:,}, Wilson={votes[2]}")
-    
-    except ValueError as e:
-        print(f"  ⚠ Error parsing votes for {county}: {e}")
+
+        try:
+            batch[county] = [int(v.replace(',', '')) for v in votes_input.split()]
+        except ValueError as e:
+            print(f"  ⚠ Error parsing votes for {county}: {e}")
+    return batch
+
+
+if args.votes_file:
+    with open(args.votes_file, encoding='utf-8') as f:
+        batch = json.load(f)
+else:
+    batch = prompt_votes()
+
+new_rows = []
+
+for county, votes in batch.items():
+    if len(votes) != len(candidates):
+        print(f"  ⚠ Error: {county} needs {len(candidates)} values, got {len(votes)}. Skipping.")
         continue
 
+    new_rows.extend(candidate_rows(county, votes))
+    print(f"  ✓ Added {county}: Paul={votes[0]:,}, Conway={votes[1]:,}, Wilson={votes[2]}")
+
 if new_rows:
     # Add new rows to dataframe
     new_df = pd.DataFrame(new_rows)
@@ -5,6 +5,8 @@ Aggregate 2023 General precinct files to county-level OpenElections format.
 from pathlib import Path
 import pandas as pd
 
+from csv_utils import read_csv_files, to_categories
+
 repo_root = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/openelections_repo")
 input_dir = repo_root / "2023" / "General"
 output_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/openelections")
@@ -22,15 +24,9 @@ csv_files = sorted(input_dir.glob("*.csv"))
 if not csv_files:
     raise FileNotFoundError(f"No CSV files found in: {input_dir}")
 
-frames = []
-for csv_file in csv_files:
-    df = pd.read_csv(csv_file)
-    df.columns = [col.lower().strip() for col in df.columns]
-    frames.append(df)
-
-combined = pd.concat(frames, ignore_index=True)
-
 required_cols = ["county", "office", "district", "candidate", "party", "votes"]
+combined = read_csv_files(csv_files, columns=required_cols)
+
 missing = [col for col in required_cols if col not in combined.columns]
 if missing:
     raise ValueError(f"Missing required columns: {missing}")
@@ -44,7 +40,9 @@ combined["candidate"] = combined["candidate"].fillna("")
 
 # Aggregate precinct -> county
 agg_cols = ["county", "office", "district", "candidate", "party"]
-county_df = combined.groupby(agg_cols, as_index=False)["votes"].sum()
+to_categories(combined, agg_cols)
+combined["votes"] = pd.to_numeric(combined["votes"], downcast="integer")
+county_df = combined.groupby(agg_cols, as_index=False, observed=True)["votes"].sum()
 
 # Add year column
 county_df.insert(0, "year", 2023)
@@ -5,6 +5,8 @@ Aggregate 2024 General statewide precinct data to county-level OpenElections for
 from pathlib import Path
 import pandas as pd
 
+from csv_utils import read_csv, to_categories
+
 repo_root = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/openelections_repo")
 input_file = repo_root / "2024" / "20241105__ky__general__precinct.csv"
 output_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/openelections")
@@ -18,10 +20,9 @@ print("=" * 80)
 if not input_file.exists():
     raise FileNotFoundError(f"Missing input file: {input_file}")
 
-df = pd.read_csv(input_file)
-df.columns = [col.lower().strip() for col in df.columns]
-
 required_cols = ["county", "office", "district", "candidate", "party", "votes"]
+df = read_csv(input_file, columns=required_cols)
+
 missing = [col for col in required_cols if col not in df.columns]
 if missing:
     raise ValueError(f"Missing required columns: {missing}")
@@ -35,7 +36,9 @@ df["candidate"] = df["candidate"].fillna("")
 
 # Aggregate precinct -> county
 agg_cols = ["county", "office", "district", "candidate", "party"]
-df_county = df.groupby(agg_cols, as_index=False)["votes"].sum()
+to_categories(df, agg_cols)
+df["votes"] = pd.to_numeric(df["votes"], downcast="integer")
+df_county = df.groupby(agg_cols, as_index=False, observed=True)["votes"].sum()
 
 # Add year column
 
@@ -2,10 +2,16 @@
 Aggregate all Kentucky election data into one comprehensive dataset.
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import sys
 
+from csv_utils import concat_frames, read_csv_parallel
+
+# district is left to pandas' type inference so the master keeps its original formatting
+CATEGORY_COLS = ['county', 'party', 'office']
+
 print("=" * 80)
 print("KENTUCKY ELECTION DATA AGGREGATOR")
 print("=" * 80)
@@ -20,23 +26,25 @@ print(f"\nFound {len(csv_files)} election CSV files:\n")
 
 all_data = []
 file_info = []
+log = []  # progress lines, written in one batch after the loop
+
+# Parse every file up front on a thread pool (PyArrow when available); column names come back
+# normalized and the repeated label columns come back as categories
+reads = read_csv_parallel(csv_files, categories=CATEGORY_COLS)
 
-for csv_file in csv_files:
+for csv_file, read in zip(csv_files, reads):
     try:
-        df = pd.read_csv(csv_file)
-        
-        # Standardize column names
-        df.columns = [col.lower().strip() for col in df.columns]
+        df = read.result()
         
         # Extract date from filename (format: YYYYMMDD)
-        filename = csv_file.stem
-        date_part = filename.split('__')[0]  # e.g., "20241105"
+        date_part = csv_file.name[:8]  # e.g., "20241105"
         
-        if len(date_part) == 8:
+        if date_part.isdigit():
             year = date_part[:4]
             df['year'] = int(year)
             df['election_date'] = date_part
         else:
+            year = None
             df['year'] = None
             df['election_date'] = None
         
@@ -47,28 +55,31 @@ for csv_file in csv_files:
         
         all_data.append(df)
         
-        # Track info
-        file_info.append({
-            'file': csv_file.name,
-            'rows': len(df),
-            'year': year,
-            'counties': df['county'].nunique() if 'county' in df.columns else 0,
-            'candidates': df['candidate'].nunique() if 'candidate' in df.columns else 0,
-            'total_votes': df['votes'].sum() if 'votes' in df.columns else 0
-        })
+        # Track info (the standard columns are guaranteed above, so each is scanned once)
+        n_counties = df['county'].nunique()
+        n_candidates = df['candidate'].nunique()
+        total_votes = df['votes'].sum()
+        file_info.append((csv_file.name, len(df), year, n_counties, n_candidates, total_votes))
         
-        print(f"  ✓ {csv_file.name}")
-        print(f"    Rows: {len(df):,} | Counties: {df['county'].nunique()}/120 | Votes: {df['votes'].sum():,.0f}")
+        log.append(f"  ✓ {csv_file.name}")
+        log.append(f"    Rows: {len(df):,} | Counties: {n_counties}/120 | Votes: {total_votes:,.0f}")
         
     except Exception as e:
-        print(f"  ✗ {csv_file.name}: {e}")
+        log.append(f"  ✗ {csv_file.name}: {e}")
+
+if log:
+    print("\n".join(log))
 
 # Combine all data
 print(f"\n{'='*80}")
 print("COMBINING DATA...")
 print(f"{'='*80}")
 
-combined_df = pd.concat(all_data, ignore_index=True)
+combined_df = concat_frames(all_data, CATEGORY_COLS)
+
+# Category keys let the groupbys below hash small integer codes instead of strings
+for col in ['county', 'candidate', 'office']:
+    combined_df[col] = combined_df[col].astype('category')
 
 print(f"\nTotal rows: {len(combined_df):,}")
 print(f"Years covered: {sorted(combined_df['year'].dropna().unique())}")
@@ -85,15 +96,15 @@ print(f"\n{'='*80}")
 print("SUMMARY BY YEAR")
 print(f"{'='*80}\n")
 
-year_summary = combined_df.groupby('year').agg({
-    'county': 'nunique',
-    'candidate': 'nunique',
-    'office': 'nunique',
-    'votes': 'sum',
-    'election_date': 'first'
+year_summary = combined_df.groupby('year', observed=True).agg(**{
+    'Counties': ('county', 'nunique'),
+    'Candidates': ('candidate', 'nunique'),
+    'Offices': ('office', 'nunique'),
+    'Total Votes': ('votes', 'sum'),
 }).round(0)
 
-year_summary.columns = ['Counties', 'Candidates', 'Offices', 'Total Votes', 'Date']
+# The election date is fixed by the year, so one de-duplication pass replaces a groupby 'first'
+year_summary['Date'] = combined_df.drop_duplicates('year').set_index('year')['election_date']
 
 print(year_summary.to_string())
 
@@ -107,7 +118,7 @@ print(f"\n{'='*80}")
 print("FILES INCLUDED IN AGGREGATION")
 print(f"{'='*80}\n")
 
-summary_df = pd.DataFrame(file_info)
+summary_df = pd.DataFrame.from_records(file_info, columns=['file', 'rows', 'year', 'counties', 'candidates', 'total_votes'])
 print(summary_df.to_string(index=False))
 
 print(f"\n{'='*80}")
@@ -125,9 +136,17 @@ print(f"\n{'='*80}")
 print("TOP 20 VOTE-GETTERS (ALL TIME)")
 print(f"{'='*80}\n")
 
-top_candidates = combined_df.groupby('candidate')[['votes']].sum().sort_values('votes', ascending=False).head(20)
-for idx, (name, row) in enumerate(top_candidates.iterrows(), 1):
-    print(f"{idx:2}. {name:40} {row['votes']:>15,.0f} votes")
+# Sum votes per candidate code with one bincount pass, then select the top 20 without sorting every total
+codes = combined_df['candidate'].cat.codes.to_numpy()
+votes = pd.to_numeric(combined_df['votes'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+named = codes >= 0
+candidate_votes = np.bincount(codes[named], weights=votes[named], minlength=len(combined_df['candidate'].cat.categories))
+top_n = min(20, len(candidate_votes))
+top_codes = np.argpartition(-candidate_votes, top_n - 1)[:top_n] if top_n else np.array([], dtype=np.intp)
+top_codes = top_codes[np.argsort(-candidate_votes[top_codes], kind='stable')]
+for idx, code in enumerate(top_codes, 1):
+    name = combined_df['candidate'].cat.categories[code]
+    print(f"{idx:2}. {name:40} {candidate_votes[code]:>15,.0f} votes")
 
 print(f"\n{'='*80}")
 print("✓ AGGREGATION COMPLETE")
@@ -3,9 +3,12 @@ Aggregate General precinct files to county-level OpenElections format for multip
 Uses local OpenElections repo clone.
 """
 
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 
+from csv_utils import read_csv_files, to_categories
+
 repo_root = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/openelections_repo")
 output_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/openelections")
 output_dir.mkdir(exist_ok=True)
@@ -17,27 +20,22 @@ print("AGGREGATE GENERAL YEARS TO COUNTY")
 print("=" * 80)
 
 
-def load_year_files(year_dir: Path) -> list:
+@lru_cache(maxsize=None)
+def load_year_files(year_dir: Path) -> tuple:
     files = []
 
     general_dir = year_dir / "General"
     if general_dir.exists():
-        files.extend(sorted(general_dir.glob("*.csv")))
+        files.extend(general_dir.glob("*.csv"))
 
     # Look for statewide precinct files at year root.
-    files.extend(sorted(year_dir.glob("*__ky__general__precinct.csv")))
+    files.extend(year_dir.glob("*__ky__general__precinct.csv"))
 
     # Some years may store precinct files at year root without double underscores.
-    files.extend(sorted(year_dir.glob("*general*precinct*.csv")))
+    files.extend(year_dir.glob("*general*precinct*.csv"))
 
-    # De-duplicate while preserving order.
-    seen = set()
-    unique = []
-    for f in files:
-        if f not in seen:
-            seen.add(f)
-            unique.append(f)
-    return unique
+    # The globs overlap; de-duplicate and sort once.
+    return tuple(sorted(dict.fromkeys(files)))
 
 
 def aggregate_year(year: int) -> None:
@@ -51,22 +49,17 @@ def aggregate_year(year: int) -> None:
         print(f"\n{year}: no General precinct files found")
         return
 
-    frames = []
-    for csv_file in files:
-        try:
-            df = pd.read_csv(csv_file)
-            df.columns = [col.lower().strip() for col in df.columns]
-            frames.append(df)
-        except Exception as exc:
-            print(f"  {year}: failed to read {csv_file.name}: {exc}")
+    required_cols = ["county", "office", "district", "candidate", "party", "votes"]
+
+    def report_error(csv_file, exc):
+        print(f"  {year}: failed to read {csv_file.name}: {exc}")
 
-    if not frames:
+    # Only the columns used by the aggregation are parsed from each file.
+    combined = read_csv_files(files, columns=required_cols, on_error=report_error)
+    if combined is None:
         print(f"\n{year}: no readable files")
         return
 
-    combined = pd.concat(frames, ignore_index=True)
-
-    required_cols = ["county", "office", "district", "candidate", "party", "votes"]
     missing = [col for col in required_cols if col not in combined.columns]
     if missing:
         print(f"\n{year}: missing columns {missing}")
@@ -80,19 +73,23 @@ def aggregate_year(year: int) -> None:
     combined["candidate"] = combined["candidate"].fillna("")
 
     agg_cols = ["county", "office", "district", "candidate", "party"]
-    county_df = combined.groupby(agg_cols, as_index=False)["votes"].sum()
+    to_categories(combined, agg_cols)
+    combined["votes"] = pd.to_numeric(combined["votes"], downcast="integer")
+    county_df = combined.groupby(agg_cols, as_index=False, observed=True)["votes"].sum()
     county_df.insert(0, "year", year)
 
     output_file = output_dir / f"KY_{year}_GENERAL_COUNTY.csv"
     county_df.to_csv(output_file, index=False)
 
-    print(f"\n{year}:")
-    print(f"  input files: {len(files)}")
-    print(f"  input rows: {len(combined):,}")
-    print(f"  output rows: {len(county_df):,}")
-    print(f"  counties: {county_df['county'].nunique()}")
-    print(f"  total votes: {county_df['votes'].sum():,}")
-    print(f"  saved: {output_file}")
+    print("\n".join([
+        f"\n{year}:",
+        f"  input files: {len(files)}",
+        f"  input rows: {len(combined):,}",
+        f"  output rows: {len(county_df):,}",
+        f"  counties: {county_df['county'].nunique()}",
+        f"  total votes: {county_df['votes'].sum():,}",
+        f"  saved: {output_file}",
+    ]))
 
 
 for year in years:
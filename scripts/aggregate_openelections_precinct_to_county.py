@@ -6,6 +6,7 @@ Usage:
     py scripts/aggregate_openelections_precinct_to_county.py 2010 2011
 """
 
+from functools import lru_cache
 from pathlib import Path
 import sys
 import pandas as pd
@@ -16,12 +17,18 @@ OE_REPO_DIR = BASE_DIR / "data" / "openelections_repo"
 OUT_DIR = BASE_DIR / "data" / "openelections"
 
 
+@lru_cache(maxsize=None)
+def _year_files(year: str) -> tuple:
+    """General precinct files for a year, globbed once per process"""
+    return tuple(sorted((OE_REPO_DIR / year).glob("*__ky__general__*__precinct.csv")))
+
+
 def aggregate_year(year: str) -> Path:
     year_dir = OE_REPO_DIR / year
     if not year_dir.exists():
         raise FileNotFoundError(f"Year directory not found: {year_dir}")
 
-    precinct_files = sorted(year_dir.glob("*__ky__general__*__precinct.csv"))
+    precinct_files = _year_files(year)
     if not precinct_files:
         raise FileNotFoundError(f"No general precinct CSV files found in: {year_dir}")
 
@@ -2,9 +2,11 @@
 Start completely fresh - check actual files and understand what we REALLY have
 """
 
-import pandas as pd
 from pathlib import Path
 import os
+import re
+
+from csv_utils import read_csv_sample
 
 data_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data")
 
@@ -12,6 +14,15 @@ print("=" * 80)
 print("FRESH START - AUDIT ALL CSV FILES")
 print("=" * 80)
 
+trump_re = re.compile('Trump|Donald', re.IGNORECASE)
+generic_re = re.compile('Candidate_', re.IGNORECASE)
+
+
+def matching_names(series, pattern):
+    """Names in series matching pattern, searched once per unique value"""
+    return [name for name in series.unique() if isinstance(name, str) and pattern.search(name)]
+
+
 # Get ALL csv files
 csv_files = sorted(data_dir.glob("*__ky__*.csv"))
 
@@ -19,39 +30,41 @@ print(f"\nFound {len(csv_files)} CSV files:\n")
 
 for f in csv_files:
     size_mb = os.path.getsize(f) / 1024 / 1024
-    print(f"{'─' * 80}")
-    print(f"FILE: {f.name} ({size_mb:.1f} MB)")
+    # Each file's report is collected and written in one batch
+    lines = [f"{'─' * 80}", f"FILE: {f.name} ({size_mb:.1f} MB)"]
     
-    df = pd.read_csv(f, nrows=1000)  # Just first 1000 rows for speed
+    df = read_csv_sample(f, 1000)  # Just first 1000 rows for speed
     
-    print(f"  Records (sample): {len(df)}")
-    print(f"  Columns: {list(df.columns)}")
+    lines.append(f"  Records (sample): {len(df)}")
+    lines.append(f"  Columns: {list(df.columns)}")
     
     # Check for year
     if 'year' in df.columns:
         years = df['year'].unique()
-        print(f"  Years: {sorted(years)}")
+        lines.append(f"  Years: {sorted(years)}")
     
     # Check for Trump
     if 'candidate' in df.columns:
-        trump_mask = df['candidate'].str.contains('Trump|Donald', case=False, na=False)
+        trump_mask = df['candidate'].isin(matching_names(df['candidate'], trump_re))
         if trump_mask.any():
             trump_votes = df[trump_mask]['votes'].sum() if 'votes' in df.columns else 0
-            print(f"  ⚠ HAS TRUMP: {trump_votes:,} votes (in first 1000 rows)")
+            lines.append(f"  ⚠ HAS TRUMP: {trump_votes:,} votes (in first 1000 rows)")
         
         # Check data quality
         if 'votes' in df.columns:
             total = df['votes'].sum()
             max_vote = df['votes'].max()
-            print(f"  Total votes (first 1000): {total:,} (max: {max_vote:,})")
+            lines.append(f"  Total votes (first 1000): {total:,} (max: {max_vote:,})")
             
             # Check for data issues
             if max_vote > 500000:
-                print(f"  ⚠ SUSPICIOUS: Single record with {max_vote:,} votes (>500k)")
+                lines.append(f"  ⚠ SUSPICIOUS: Single record with {max_vote:,} votes (>500k)")
             
-            generic = df[df['candidate'].str.contains('Candidate_', case=False, na=False)]
+            generic = df[df['candidate'].isin(matching_names(df['candidate'], generic_re))]
             if len(generic) > 0:
-                print(f"  ⚠ CORRUPTED: {len(generic)} 'Candidate_#' placeholder entries")
+                lines.append(f"  ⚠ CORRUPTED: {len(generic)} 'Candidate_#' placeholder entries")
+    
+    print("\n".join(lines))
 
 print("\n" + "=" * 80)
 print("RECOMMENDATION")
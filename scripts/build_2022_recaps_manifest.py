@@ -4,6 +4,13 @@ Build a JSON manifest of downloaded 2022 recap PDFs.
 
 from pathlib import Path
 import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 output_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/2022_recaps")
 manifest_path = output_dir / "2022_recaps_manifest.json"
@@ -35,10 +42,16 @@ manifest = {
     "missing": [],
 }
 
+# Snapshot the directory once instead of stat-ing every county's file
+try:
+    existing = {os.path.normcase(entry.name) for entry in os.scandir(output_dir)}
+except FileNotFoundError:
+    existing = set()
+
 for county in counties:
     filename = f"{county} County.pdf"
     file_path = output_dir / filename
-    if file_path.exists():
+    if os.path.normcase(filename) in existing:
         manifest["files"][county] = {
             "file": str(file_path),
             "status": "downloaded",
@@ -49,7 +62,10 @@ for county in counties:
 manifest["downloaded_count"] = len(manifest["files"])
 manifest["missing_count"] = len(manifest["missing"])
 
-manifest_path.write_text(json.dumps(manifest, indent=2))
+if ORJSON_AVAILABLE:
+    manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+else:
+    manifest_path.write_text(json.dumps(manifest, indent=2))
 
 print("=" * 80)
 print("2022 RECAPS MANIFEST")
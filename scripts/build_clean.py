@@ -4,9 +4,17 @@ FRESH START: Build clean dataset from ONLY good CSV files
 - USE: All other *county.csv files
 """
 
+import re
+
 import pandas as pd
 from pathlib import Path
 
+from csv_utils import concat_frames, read_csv_parallel
+
+CATEGORY_COLS = ['county', 'party']
+ESSENTIAL_COLS = ['county', 'candidate', 'party', 'votes']
+KEEP_COLS = ESSENTIAL_COLS + ['year']
+
 data_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data")
 
 print("=" * 80)
@@ -41,16 +49,23 @@ print(f"\nLoading {len(good_files)} FILES:\n")
 
 all_data = []
 
+# Parse the files that exist concurrently, only the columns kept below; names come back standardized
+found_files = [fname for fname in good_files if (data_dir / fname).exists()]
+reads = read_csv_parallel(
+    [data_dir / fname for fname in found_files],
+    columns=KEEP_COLS,
+    categories=CATEGORY_COLS,
+)
+frames = {fname: read.result() for fname, read in zip(found_files, reads)}
+
+log = []  # progress lines, written in one batch after the loop
+
 for fname in good_files:
-    fpath = data_dir / fname
-    if not fpath.exists():
-        print(f"  ✗ NOT FOUND: {fname}")
+    if fname not in frames:
+        log.append(f"  ✗ NOT FOUND: {fname}")
         continue
     
-    df = pd.read_csv(fpath)
-    
-    # Standardize columns
-    df.columns = [col.lower().strip() for col in df.columns]
+    df = frames[fname]
     
     # Extract year from filename
     year = int(fname[:4])
@@ -58,22 +73,23 @@ for fname in good_files:
         df['year'] = year
     
     # Keep only essential columns
-    essential_cols = ['county', 'candidate', 'party', 'votes']
-    for col in essential_cols:
-        if col not in df.columns:
-            print(f"  ⚠ {fname} missing '{col}'")
+    missing = set(ESSENTIAL_COLS).difference(df.columns)
+    if missing:
+        log.append(f"  ⚠ {fname} missing {sorted(missing)}")
     
-    # Select only essential columns that exist
-    cols_to_keep = [col for col in ['county', 'candidate', 'party', 'votes', 'year'] if col in df.columns]
-    df = df[cols_to_keep]
+    # Select only essential columns that exist, in a fixed order
+    df = df[[col for col in KEEP_COLS if col in df.columns]]
     
-    print(f"  ✓ {fname:45} {len(df):>5} records, {df['votes'].sum():>12,.0f} votes")
+    log.append(f"  ✓ {fname:45} {len(df):>5} records, {df['votes'].sum():>12,.0f} votes")
     
     all_data.append(df)
 
+if log:
+    print("\n".join(log))
+
 # Combine
 print(f"\nCombining...")
-df_final = pd.concat(all_data, ignore_index=True)
+df_final = concat_frames(all_data, CATEGORY_COLS)
 
 print(f"  Combined: {len(df_final):,} records")
 print(f"  Total votes: {df_final['votes'].sum():,.0f}")
@@ -82,15 +98,10 @@ print(f"  Total votes: {df_final['votes'].sum():,.0f}")
 print(f"\nCleaning...")
 before = len(df_final)
 
-# Remove nulls in critical fields
-df_final = df_final.dropna(subset=['county', 'candidate', 'votes'])
-
-# Convert votes to numeric
-df_final['votes'] = pd.to_numeric(df_final['votes'], errors='coerce')
-df_final = df_final.dropna(subset=['votes'])
-
-# Remove zero-vote records
-df_final = df_final[df_final['votes'] > 0]
+# Convert votes to numeric, then drop nulls in critical fields and zero-vote records in one pass
+votes = pd.to_numeric(df_final['votes'], errors='coerce')
+keep = df_final['county'].notna() & df_final['candidate'].notna() & (votes > 0)
+df_final = df_final.loc[keep].assign(votes=votes[keep])
 
 print(f"  Removed {before - len(df_final):,} problematic records")
 print(f"  Final: {len(df_final):,} records, {df_final['votes'].sum():,.0f} votes")
@@ -106,7 +117,7 @@ print(f"Candidates: {df_final['candidate'].nunique():,}")
 print(f"Election years: {sorted(df_final['year'].unique())}")
 
 print(f"\nTOP 15 CANDIDATES:")
-top_15 = df_final.groupby('candidate')['votes'].sum().sort_values(ascending=False).head(15)
+top_15 = df_final.groupby('candidate', observed=True, sort=False)['votes'].sum().nlargest(15)
 for idx, (name, votes) in enumerate(top_15.items(), 1):
     print(f"{idx:2}. {name:35} {votes:>12,.0f}")
 
@@ -116,10 +127,13 @@ print(f"CHECKING FOR NAME VARIANTS")
 print(f"=" * 80)
 
 # Check for Trump variants
-trump_variants = df_final[df_final['candidate'].str.contains('Trump|Donald', case=False, na=False)]['candidate'].unique()
+# Match the regex against the unique names only, then select their rows by membership
+trump_re = re.compile('Trump|Donald', re.IGNORECASE)
+trump_variants = [name for name in df_final['candidate'].unique() if isinstance(name, str) and trump_re.search(name)]
+trump_votes = df_final[df_final['candidate'].isin(trump_variants)].groupby('candidate')['votes'].sum()
 print(f"\nTrump variants: {len(trump_variants)}")
 for name in sorted(trump_variants):
-    votes = df_final[df_final['candidate'] == name]['votes'].sum()
+    votes = trump_votes[name]
     print(f"  {name:35} {votes:>12,.0f}")
 
 # Save
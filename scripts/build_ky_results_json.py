@@ -3,10 +3,38 @@ Build a KY election results JSON from county-level OpenElections files and histo
 Applies margin calculations using the legend criteria.
 """
 
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import json
+import os
+import numpy as np
 import pandas as pd
 import re
+import string
+import sys
+
+from csv_utils import concat_frames, read_csv_parallel, read_header, to_categories
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    import difflib
+    RAPIDFUZZ_AVAILABLE = False
 
 input_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data")
 output_file = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data/ky_election_results.json")
@@ -34,13 +62,61 @@ for txt_candidate in [
     if candidate_path.exists():
         txt_files.append(candidate_path)
 
-all_dataframes = []
-
-
+# Patterns compiled once for the county-name helpers and the txt parser
+COUNTY_KEY_STRIP_RE = re.compile(r"[^A-Za-z0-9 .-]")
+COUNTY_SUFFIX_RE = re.compile(r"\s+COUNTY$")
+OFFICE_RE = re.compile(r"OFFICE:\s+[A-Z0-9/]+\s+(.*)")
+COUNTY_TOKEN_RE = re.compile(r"(?<!\S)\*(\S*)")
+# Historical txt files carry a 4-digit (2004) or bare 2-digit (00Gen, "gen 08") year
+TXT_YEAR_RE = re.compile(r"(?<!\d)(?:20)?(\d{2})(?!\d)")
+TXT_YEARS = frozenset({2000, 2002, 2003, 2004, 2006, 2007, 2008})
+COMMA_TABLE = str.maketrans("", "", ",")
+# Bytes str.strip() treats as whitespace once a txt line is decoded as latin-1
+LATIN1_WHITESPACE = bytes(c for c in range(256) if chr(c).isspace())
+VOTE_LINE_END = frozenset(b"0123456789,")
+
+
+class KeepOnly(dict):
+    """str.translate table that deletes every character except the given ones."""
+
+    def __init__(self, chars: str):
+        super().__init__((ord(c), c) for c in chars)
+
+    def __missing__(self, codepoint):
+        return None
+
+
+ABBR_CHARS = KeepOnly(string.ascii_uppercase + string.digits)
+ALPHA_CHARS = KeepOnly(string.ascii_uppercase)
+
+# Known SOS/TXT abbreviation quirks
+TXT_ABBR_QUIRKS = {
+    "GREU": "Greenup",
+    "KENT": "Kenton",
+    "MASO": "Mason",
+    "MCCK": "McCracken",
+    "MCCR": "McCreary",
+    "MCLE": "McLean",
+}
+
+# Known spelling/label variants seen in legacy files
+COUNTY_SPELLING_VARIANTS = {
+    "Breckenridge": "Breckinridge",
+    "Bulter": "Butler",
+}
+
+# Party labels that map to the dem/rep buckets; anything else is "other"
+PARTY_BUCKETS = {
+    "DEM": "dem", "DEMOCRAT": "dem", "D": "dem",
+    "REP": "rep", "REPUBLICAN": "rep", "R": "rep", "GOP": "rep",
+}
+
+
+@lru_cache(maxsize=4096)
 def normalize_county_key(text: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9 .-]", "", str(text or ""))
-    value = re.sub(r"\s+", " ", value).strip()
-    return value
+    # Only spaces survive the strip, so split/join collapses runs without a second regex pass
+    value = COUNTY_KEY_STRIP_RE.sub("", str(text or ""))
+    return " ".join(value.split())
 
 
 def load_county_lookup(path: Path) -> tuple[dict, dict]:
@@ -57,17 +133,16 @@ def load_county_lookup(path: Path) -> tuple[dict, dict]:
     normalized_map = {}
     abbr_map = {}
 
-    for _, row in df.iterrows():
-        county_name = str(row["county_name"]).strip()
+    for county_name, namelsad, match_key in zip(df["county_name"].str.strip(), df["county_namelsad"], df["match_key_normalized"]):
         if not county_name:
             continue
 
         keys = {
             normalize_county_key(county_name),
-            normalize_county_key(row["county_namelsad"]),
-            normalize_county_key(row["match_key_normalized"]),
+            normalize_county_key(namelsad),
+            normalize_county_key(match_key),
         }
-        county_no_suffix = re.sub(r"\s+COUNTY$", "", normalize_county_key(county_name))
+        county_no_suffix = COUNTY_SUFFIX_RE.sub("", normalize_county_key(county_name))
         if county_no_suffix:
             keys.add(county_no_suffix)
 
@@ -76,30 +151,34 @@ def load_county_lookup(path: Path) -> tuple[dict, dict]:
                 normalized_map[key] = county_name
 
         # Default 4-char abbreviation used in historical TXT county headers
-        alpha = re.sub(r"[^A-Z]", "", county_name.upper())
+        alpha = county_name.upper().translate(ALPHA_CHARS)
         if len(alpha) >= 4:
             abbr_map.setdefault(alpha[:4], county_name.title())
 
-    # Known SOS/TXT abbreviation quirks
-    abbr_map.update({
-        "GREU": "Greenup",
-        "KENT": "Kenton",
-        "MASO": "Mason",
-        "MCCK": "McCracken",
-        "MCCR": "McCreary",
-        "MCLE": "McLean",
-    })
-
-    # Known spelling/label variants seen in legacy files
-    normalized_map[normalize_county_key("Breckenridge")] = "Breckinridge"
-    normalized_map[normalize_county_key("Bulter")] = "Butler"
+    abbr_map.update(TXT_ABBR_QUIRKS)
+    for variant, county_name in COUNTY_SPELLING_VARIANTS.items():
+        normalized_map[normalize_county_key(variant)] = county_name
 
     return normalized_map, abbr_map
 
 
 COUNTY_NORMALIZED_MAP, COUNTY_ABBR_MAP = load_county_lookup(county_lookup_file)
+# Lower-cased canonical names for the fuzzy spelling fallback
+CANONICAL_COUNTIES = {name.lower(): name for name in COUNTY_NORMALIZED_MAP.values()}
+FUZZY_COUNTY_CUTOFF = 90
 
 
+def closest_county(name: str):
+    """Canonical county whose spelling is within the fuzzy cutoff of name, or None."""
+    query = name.lower()
+    if RAPIDFUZZ_AVAILABLE:
+        match = process.extractOne(query, CANONICAL_COUNTIES.keys(), scorer=fuzz.ratio, score_cutoff=FUZZY_COUNTY_CUTOFF)
+        return CANONICAL_COUNTIES[match[0]] if match else None
+    matches = difflib.get_close_matches(query, CANONICAL_COUNTIES.keys(), n=1, cutoff=FUZZY_COUNTY_CUTOFF / 100)
+    return CANONICAL_COUNTIES[matches[0]] if matches else None
+
+
+@lru_cache(maxsize=4096)
 def canonicalize_county_name(raw_county: str) -> str:
     key = normalize_county_key(raw_county)
     if not key:
@@ -108,10 +187,15 @@ def canonicalize_county_name(raw_county: str) -> str:
     if key in COUNTY_NORMALIZED_MAP:
         return COUNTY_NORMALIZED_MAP[key]
 
-    no_suffix = re.sub(r"\s+COUNTY$", "", key)
+    no_suffix = COUNTY_SUFFIX_RE.sub("", key)
     if no_suffix in COUNTY_NORMALIZED_MAP:
         return COUNTY_NORMALIZED_MAP[no_suffix]
 
+    # Catch misspellings that have no explicit variant entry
+    closest = closest_county(no_suffix)
+    if closest:
+        return closest
+
     # Stop capping all last names, just return as-is
     return str(raw_county).strip()
 
@@ -119,65 +203,37 @@ def canonicalize_county_name(raw_county: str) -> str:
 def party_bucket(party: str) -> str:
     if not isinstance(party, str):
         return "other"
-    p = party.strip().upper()
-    if p in {"DEM", "DEMOCRAT", "D"}:
-        return "dem"
-    if p in {"REP", "REPUBLICAN", "R", "GOP"}:
-        return "rep"
-    return "other"
-
-
-def get_competitiveness(margin_pct: float, winner_party: str) -> dict:
-    """Map margin percentage to competitiveness category with color."""
-    colors = {
-        "Annihilation": {"REP": "#67000d", "DEM": "#08306b"},
-        "Dominant": {"REP": "#a50f15", "DEM": "#08519c"},
-        "Stronghold": {"REP": "#cb181d", "DEM": "#3182bd"},
-        "Safe": {"REP": "#ef3b2c", "DEM": "#6baed6"},
-        "Likely": {"REP": "#fb6a4a", "DEM": "#9ecae1"},
-        "Lean": {"REP": "#fcae91", "DEM": "#c6dbef"},
-        "Tilt": {"REP": "#fee8c8", "DEM": "#e1f5fe"},
-        "Tossup": {"REP": "#f7f7f7", "DEM": "#f7f7f7"},
-    }
-    
-    code_parts = {
-        "Annihilation": "ANNIHILATION",
-        "Dominant": "DOMINANT",
-        "Stronghold": "STRONGHOLD",
-        "Safe": "SAFE",
-        "Likely": "LIKELY",
-        "Lean": "LEAN",
-        "Tilt": "TILT",
-        "Tossup": "TOSSUP",
-    }
-    
-    if margin_pct >= 40:
-        category = "Annihilation"
-    elif margin_pct >= 30:
-        category = "Dominant"
-    elif margin_pct >= 20:
-        category = "Stronghold"
-    elif margin_pct >= 10:
-        category = "Safe"
-    elif margin_pct >= 5.50:
-        category = "Likely"
-    elif margin_pct >= 1.00:
-        category = "Lean"
-    elif margin_pct >= 0.50:
-        category = "Tilt"
-    else:
-        category = "Tossup"
-    
-    code = f"{winner_party}_{code_parts[category]}"
-    
-    return {
-        "category": category,
-        "party": winner_party,
-        "code": code,
-        "color": colors[category][winner_party]
-    }
-
-
+    return PARTY_BUCKETS.get(party.strip().upper(), "other")
+
+
+# Competitiveness categories from closest to widest margin; a margin at or above
+# COMPETITIVENESS_BINS[i - 1] (and below COMPETITIVENESS_BINS[i]) falls in category i
+COMPETITIVENESS_BINS = np.array([0.50, 1.00, 5.50, 10, 20, 30, 40])
+COMPETITIVENESS_CATEGORIES = np.array(["Tossup", "Tilt", "Lean", "Likely", "Safe", "Stronghold", "Dominant", "Annihilation"])
+COMPETITIVENESS_CODES = np.array([category.upper() for category in COMPETITIVENESS_CATEGORIES])
+COMPETITIVENESS_COLORS = {
+    "REP": np.array(["#f7f7f7", "#fee8c8", "#fcae91", "#fb6a4a", "#ef3b2c", "#cb181d", "#a50f15", "#67000d"]),
+    "DEM": np.array(["#f7f7f7", "#e1f5fe", "#c6dbef", "#9ecae1", "#6baed6", "#3182bd", "#08519c", "#08306b"]),
+}
+# (winner, category) lookup tables, one row per winner; ties use the REP palette
+WINNERS = ["DEM", "REP", "TIE"]
+COMPETITIVENESS_CODE_TABLE = np.array([[f"{winner}_{code}" for code in COMPETITIVENESS_CODES] for winner in WINNERS])
+COMPETITIVENESS_COLOR_TABLE = np.array([COMPETITIVENESS_COLORS["DEM"], COMPETITIVENESS_COLORS["REP"], COMPETITIVENESS_COLORS["REP"]])
+
+
+def get_competitiveness(margin_pct, winner_party) -> tuple:
+    """
+    Map arrays of margin percentages and winners (DEM/REP/TIE) to competitiveness (category, code, color) arrays.
+    Ties are always Tossup.
+    """
+    winner_party = np.asarray(winner_party)
+    winner_idx = np.select([winner_party == "DEM", winner_party == "REP"], [0, 1], 2)
+    idx = np.searchsorted(COMPETITIVENESS_BINS, margin_pct, side="right")
+    idx[winner_idx == 2] = 0
+    return COMPETITIVENESS_CATEGORIES[idx], COMPETITIVENESS_CODE_TABLE[winner_idx, idx], COMPETITIVENESS_COLOR_TABLE[winner_idx, idx]
+
+
+@lru_cache(maxsize=None)
 def get_contest_name(office: str) -> str:
     """Convert office to friendly contest name."""
     office_lower = (office or "").strip().lower()
@@ -204,180 +260,174 @@ def get_contest_name(office: str) -> str:
         return office
 
 
+# Candidate surnames used to guess party in the historical txt data
+DEM_NAMES = (
+    # National
+    "gore", "lieberman", "weinberg", "mondale", "ferraro", "dukakis",
+    "bentsen", "clinton", "kerry", "edwards", "obama", "biden",
+    "harris", "waltz", "robinson", "combs", "grimes", "adkins",
+    # 2003 KY statewide
+    "chandler", "owen", "maple", "stumbo", "luallen", "miller", "baesler",
+    # 2007 KY statewide
+    "beshear", "mongiardo", "hendrickson", "conway", "luallen", "hollenbach", "williams",
+    # 2008 US Senate
+    "lunsford",
+)
+REP_NAMES = (
+    # National
+    "bush", "cheney", "dole", "kemp", "reagan", "quayle", "mccain",
+    "palin", "romney", "ryan", "trump", "pence", "mcconnell", "nolan",
+    "williams", "forgy", "bunning",
+    # 2003 KY statewide
+    "fletcher", "pence", "grayson", "wood", "greenwell", "koenig", "farmer",
+    # 2007 KY statewide
+    "fletcher", "rudolph", "grayson", "lee", "greenwell", "wheeler", "farmer",
+)
+
+
+def compile_names(names) -> re.Pattern:
+    """One case-insensitive alternation over the names, longest first."""
+    return re.compile("|".join(map(re.escape, sorted(set(names), key=len, reverse=True))), re.IGNORECASE)
+
+
+DEM_RE = compile_names(DEM_NAMES)
+REP_RE = compile_names(REP_NAMES)
+if AHOCORASICK_AVAILABLE:
+    # Scan for every surname at once; a name on both lists counts as DEM, which is checked first
+    PARTY_AUTOMATON = ahocorasick.Automaton()
+    for surname in set(REP_NAMES) | set(DEM_NAMES):
+        PARTY_AUTOMATON.add_word(surname, "DEM" if surname in DEM_NAMES else "REP")
+    PARTY_AUTOMATON.make_automaton()
+
+
+@lru_cache(maxsize=2048)
 def guess_party(candidate: str) -> str:
     """Heuristically guess party from candidate info (for historical txt data)."""
-    name_lower = (candidate or "").lower()
-    dem_names = {
-        # National
-        "gore", "lieberman", "weinberg", "mondale", "ferraro", "dukakis", 
-        "bentsen", "clinton", "kerry", "edwards", "obama", "biden",
-        "harris", "waltz", "robinson", "combs", "grimes", "adkins",
-        # 2003 KY statewide
-        "chandler", "owen", "maple", "stumbo", "luallen", "miller", "baesler",
-        # 2007 KY statewide
-        "beshear", "mongiardo", "hendrickson", "conway", "luallen", "hollenbach", "williams",
-        # 2008 US Senate
-        "lunsford",
-    }
-    rep_names = {
-        # National
-        "bush", "cheney", "dole", "kemp", "reagan", "quayle", "mccain",
-        "palin", "romney", "ryan", "trump", "pence", "mcconnell", "nolan",
-        "williams", "forgy", "bunning",
-        # 2003 KY statewide
-        "fletcher", "pence", "grayson", "wood", "greenwell", "koenig", "farmer",
-        # 2007 KY statewide
-        "fletcher", "rudolph", "grayson", "lee", "greenwell", "wheeler", "farmer",
-    }
-    
-    for dem in dem_names:
-        if dem in name_lower:
-            return "DEM"
-    for rep in rep_names:
-        if rep in name_lower:
-            return "REP"
+    name = candidate or ""
+    if AHOCORASICK_AVAILABLE:
+        party = "OTHER"
+        for _, party_hit in PARTY_AUTOMATON.iter(name.lower()):
+            if party_hit == "DEM":
+                return "DEM"
+            party = "REP"
+        return party
+    if DEM_RE.search(name):
+        return "DEM"
+    if REP_RE.search(name):
+        return "REP"
     return "OTHER"
 
 
+TXT_COLUMNS = ['year', 'county', 'office', 'district', 'candidate', 'party', 'votes']
+
+
 def parse_txt_file(filepath: Path) -> pd.DataFrame:
     """Parse Kentucky election txt files with county-by-candidate format."""
-    filename = filepath.stem.lower()
-    filename_full = filepath.name.lower()
-    
     # Extract year from filename
-    if "00gen" in filename or "2000" in filename_full:
-        year = 2000
-    elif "2002" in filename_full:
-        year = 2002
-    elif "2003" in filename_full:
-        year = 2003
-    elif "2004" in filename_full:
-        year = 2004
-    elif "2006" in filename_full:
-        year = 2006
-    elif "2007" in filename_full:
-        year = 2007
-    elif "2008" in filename_full or "08" in filename_full:
-        year = 2008
-    else:
+    match = TXT_YEAR_RE.search(filepath.name)
+    year = 2000 + int(match.group(1)) if match else None
+    if year not in TXT_YEARS:
         return pd.DataFrame()
     
     rows = []
     try:
-        with open(filepath, 'r', encoding='latin-1', errors='ignore') as f:
-            content = f.read()
-    except:
+        f = open(filepath, 'rb')
+    except OSError:
         return pd.DataFrame()
     
-    lines = content.split('\n')
     current_office = None
     county_order = []
+    header_cache = {}
     
-    for i, line in enumerate(lines):
-        # Extract office - handle multi-line office names
-        if 'OFFICE:' in line:
-            # Extract everything after "OFFICE: A##/###/###"
-            match = re.search(r'OFFICE:\s+[A-Z0-9/]+\s+(.*)', line)
-            if match:
-                office_part = match.group(1).strip()
-                # If line continues to next, append it
-                if i + 1 < len(lines) and lines[i + 1].strip() and not lines[i + 1].strip()[0].isupper() and '*' not in lines[i + 1]:
-                    office_part += " " + lines[i + 1].strip()
-                current_office = office_part
-                county_order = []
+    # Stream the raw bytes; a line read ahead for an office continuation is pushed back
+    lines = iter(f)
+    pending = []
+    with f:
+        while True:
+            raw = pending.pop() if pending else next(lines, None)
+            if raw is None:
+                break
+            # Only office lines, county headers and lines ending in a count can matter,
+            # so everything else is dropped before it is decoded
+            if b'OFFICE' not in raw and raw.count(b'*') < 3:
+                tail = raw.rstrip(LATIN1_WHITESPACE)
+                if not tail or tail[-1] not in VOTE_LINE_END:
+                    continue
+            line = raw.decode('latin-1')
+            stripped = line.strip()
+            if not stripped:
+                continue
+        
+            # Extract office - handle multi-line office names
+            if 'OFFICE:' in stripped:
+                # Extract everything after "OFFICE: A##/###/###"
+                match = OFFICE_RE.search(line)
+                if match:
+                    office_part = match.group(1).strip()
+                    # If line continues to next, append it
+                    next_raw = next(lines, b'')
+                    if next_raw:
+                        pending.append(next_raw)
+                    next_line = next_raw.decode('latin-1')
+                    if next_line.strip() and not next_line.strip()[0].isupper() and '*' not in next_line:
+                        office_part += " " + next_line.strip()
+                    current_office = office_part
+                    county_order = []
+                continue
         
-        # Find county header line (contains *ABBR patterns)
-        if line.strip() and '*' in line and (line.count('*') >= 3):
-            parts = line.split()
-            county_order = []
-            for p in parts:
-                if p.startswith('*'):
-                    abbr = re.sub(r"[^A-Z0-9]", "", p[1:].upper())
-                    county_name = COUNTY_ABBR_MAP.get(abbr, abbr.title())
-                    county_order.append(county_name.title())
+            # Find county header line (contains *ABBR patterns)
+            if '*' in stripped and stripped.count('*') >= 3:
+                # The same header block repeats for every office, so resolve each distinct one once
+                county_order = header_cache.get(stripped)
+                if county_order is None:
+                    county_order = []
+                    for token in COUNTY_TOKEN_RE.findall(stripped):
+                        abbr = token.upper().translate(ABBR_CHARS)
+                        county_name = COUNTY_ABBR_MAP.get(abbr, abbr.title())
+                        # Canonicalize once per header rather than once per vote cell
+                        county_order.append(canonicalize_county_name(county_name.title()))
+                    header_cache[stripped] = county_order
         
-        # Parse vote lines (candidate + numbers)
-        if current_office and county_order and line.strip() and not 'OFFICE' in line:
-            parts = line.split()
+            # Parse vote lines (candidate + numbers); a vote line has to end in a digit
+            # (or a thousands comma), so every other line is skipped without attempting int()
+            last = stripped[-1]
+            if current_office and county_order and (last.isdigit() or last == ',') and 'OFFICE' not in stripped:
+                n = len(county_order)
+                # Split only the trailing N count columns off; the candidate name stays one string
+                parts = stripped.rsplit(None, n)
             
-            # Need at least candidate name + county count numbers
-            if len(parts) >= len(county_order):
-                # Check if last N items are numbers
-                vote_nums = parts[-len(county_order):]
+                # Need candidate name + county count numbers
+                if len(parts) > n:
+                    vote_nums = parts[1:]
                 
-                try:
-                    # Try to parse all as integers
-                    votes = []
-                    for v in vote_nums:
-                        # Handle commas in numbers
-                        clean_v = v.replace(',', '')
-                        votes.append(int(clean_v))
+                    try:
+                        # Try to parse all as integers, only stripping thousands commas when the line has any
+                        if ',' in stripped:
+                            votes = [int(v.translate(COMMA_TABLE)) for v in vote_nums]
+                        else:
+                            votes = list(map(int, vote_nums))
                     
-                    # Success - this is a vote line
-                    candidate = ' '.join(parts[:-len(county_order)]).strip().title()
+                        # Success - this is a vote line
+                        candidate = ' '.join(parts[0].split()).title()
                     
-                    # Filter out blank lines and headers
-                    if candidate and len(candidate) > 1:
-                        party = guess_party(candidate)
-                        for county_name, vote_count in zip(county_order, votes):
-                            canonical_county = canonicalize_county_name(county_name)
-                            if vote_count > 0 and canonical_county:  # Only add non-zero votes
-                                rows.append({
-                                    'year': year,
-                                    'county': canonical_county,
-                                    'office': current_office,
-                                    'district': '',
-                                    'candidate': candidate,
-                                    'party': party,
-                                    'votes': vote_count
-                                })
-                except (ValueError, IndexError):
-                    # Not a vote line, skip
-                    pass
+                        # Filter out blank lines and headers
+                        if candidate and len(candidate) > 1:
+                            party = guess_party(candidate)
+                            rows.extend(
+                                (year, county, current_office, '', candidate, party, vote_count)
+                                for county, vote_count in zip(county_order, votes)
+                                if vote_count > 0 and county  # Only add non-zero votes
+                            )
+                    except (ValueError, IndexError):
+                        # Not a vote line, skip
+                        pass
     
-    return pd.DataFrame(rows)
+    return pd.DataFrame.from_records(rows, columns=TXT_COLUMNS)
 
 
-# Parse CSV files
-for csv_file in csv_files:
-    df = pd.read_csv(csv_file)
-    df.columns = [col.lower().strip() for col in df.columns]
-    required = ["year", "county", "office", "district", "candidate", "party", "votes"]
-    missing = [col for col in required if col not in df.columns]
-    if missing:
-        print(f"Warning: {csv_file.name} missing columns: {missing}")
-        continue
-    # Normalize party values using party_bucket
-    df["party"] = df["party"].apply(party_bucket)
-    # Stop uppercasing all candidate last names (leave as-is)
-    all_dataframes.append(df)
-
-# Parse TXT files
-for txt_file in txt_files:
-    print(f"Parsing {txt_file.name}...")
-    df = parse_txt_file(txt_file)
-    if not df.empty:
-        all_dataframes.append(df)
-        print(f"  -> {len(df)} rows extracted")
-
-# Combine all data
-if not all_dataframes:
-    raise SystemExit("No data files found!")
-
-combined_df = pd.concat(all_dataframes, ignore_index=True)
-combined_df["county"] = combined_df["county"].map(canonicalize_county_name)
-combined_df = combined_df[combined_df["county"].astype(str).str.strip() != ""].copy()
-combined_df["votes"] = (
-    pd.to_numeric(
-        combined_df["votes"].astype(str).str.replace(",", "", regex=False),
-        errors="coerce",
-    )
-    .fillna(0)
-    .astype(int)
-)
-combined_df["year"] = pd.to_numeric(combined_df["year"], errors="coerce")
-combined_df = combined_df.dropna(subset=["year"]).copy()
-combined_df["year"] = combined_df["year"].astype(int)
+REQUIRED_COLS = ["year", "county", "office", "district", "candidate", "party", "votes"]
+# Repeated text columns are dictionary-encoded per file so the combined frame stays compact
+CATEGORY_COLS = ["county", "office", "candidate", "party"]
 
 # List of statewide offices
 STATEWIDE_OFFICES = [
@@ -389,122 +439,204 @@ STATEWIDE_OFFICES = [
     "auditor of public accounts", "state auditor",
     "commissioner of agriculture",
 ]
+STATEWIDE_RE = re.compile("|".join(map(re.escape, STATEWIDE_OFFICES)), re.IGNORECASE)
+if AHOCORASICK_AVAILABLE:
+    # Match every office token in a single automaton pass
+    STATEWIDE_AUTOMATON = ahocorasick.Automaton()
+    for token in STATEWIDE_OFFICES:
+        STATEWIDE_AUTOMATON.add_word(token, token)
+    STATEWIDE_AUTOMATON.make_automaton()
+
+# Non-candidate rows
+SKIP_CANDIDATES = ["", "Over Votes", "Under Votes", "Total Votes"]
+
+BUCKETS = ["dem", "rep", "other"]
+
 
 def is_statewide_office(office: str) -> bool:
-    text = (office or "").strip().lower()
-    return any(token in text for token in STATEWIDE_OFFICES)
-
-results_by_year = {}
-
-for _, row in combined_df.iterrows():
-    year = int(row["year"])
-    county = str(row["county"]).strip()
-    office = str(row["office"]).strip()
-    district = str(row["district"]).strip() if pd.notna(row.get("district")) else ""
-    candidate = str(row["candidate"]).strip().title()
-    party = str(row["party"]).strip()
-    votes = int(row["votes"]) if pd.notna(row["votes"]) else 0
-
-    # Skip non-candidate rows
-    skip_candidates = {"", "Over Votes", "Under Votes", "Total Votes"}
-    if candidate in skip_candidates or party == "":
-        continue
-
-    if not is_statewide_office(office):
-        continue
-
-    contest_key = office if not district else f"{office} - {district}"
-
-    results_by_year.setdefault(str(year), {})
-    results_by_year[str(year)].setdefault(office or "Unknown", {})
-    contest = results_by_year[str(year)][office or "Unknown"].setdefault(contest_key, {"results": {}})
-
-    county_results = contest["results"].setdefault(
-        county,
-        {
-            "contest_name": get_contest_name(office),
-            "year": year,
-            "county": county,
-            "dem_votes": 0,
-            "rep_votes": 0,
-            "other_votes": 0,
-            "total_votes": 0,
-            "two_party_total": 0,
-            "dem_candidate": "",
-            "rep_candidate": "",
-            "winner": "",
-            "margin": 0,
-            "margin_pct": 0,
-            "competitiveness": {},
-            "all_parties": {},
-        },
+    text = office or ""
+    if AHOCORASICK_AVAILABLE:
+        return next(STATEWIDE_AUTOMATON.iter(text.lower()), None) is not None
+    return STATEWIDE_RE.search(text) is not None
+
+
+def map_unique(series: pd.Series, func) -> pd.Series:
+    """Apply func once per distinct value (missing values included) and broadcast back to every row."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    mapped = np.array([func(value) for value in uniques], dtype=object)
+    # Keep object dtype so every row holding a value shares the same string object
+    return pd.Series(mapped[codes], index=series.index, dtype=object)
+
+
+def as_text(value) -> str:
+    return str(value).strip()
+
+
+def statewide_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep only rows for statewide offices, so other contests are dropped before the frames are combined."""
+    return df[map_unique(df["office"], lambda office: is_statewide_office(as_text(office))).astype(bool)]
+
+
+def main():
+    # Parse CSV files, checking each header first so files missing columns are never parsed
+    all_dataframes = []
+    readable = []
+    for csv_file in csv_files:
+        header = {col.lower().strip() for col in read_header(csv_file)}
+        missing = [col for col in REQUIRED_COLS if col not in header]
+        if missing:
+            print(f"Warning: {csv_file.name} missing columns: {missing}")
+            continue
+        readable.append(csv_file)
+
+    # The remaining files are parsed concurrently, then normalized in file order
+    for read in read_csv_parallel(readable, columns=REQUIRED_COLS, categories=CATEGORY_COLS):
+        df = read.result()
+        # Normalize party values using party_bucket
+        df["party"] = map_unique(df["party"], party_bucket).astype("category")
+        # Stop uppercasing all candidate last names (leave as-is)
+        all_dataframes.append(statewide_rows(df))
+
+    # Parse TXT files, one worker process per file (each parse is CPU-bound)
+    if txt_files:
+        with ProcessPoolExecutor(max_workers=min(len(txt_files), os.cpu_count() or 1)) as executor:
+            txt_frames = list(executor.map(parse_txt_file, txt_files))
+    else:
+        txt_frames = []
+    for txt_file, df in zip(txt_files, txt_frames):
+        print(f"Parsing {txt_file.name}...")
+        if not df.empty:
+            print(f"  -> {len(df)} rows extracted")
+            all_dataframes.append(statewide_rows(to_categories(df, CATEGORY_COLS)))
+
+    # Combine all data
+    if not all_dataframes:
+        raise SystemExit("No data files found!")
+
+    combined_df = concat_frames(all_dataframes, CATEGORY_COLS)
+
+    # Coerce every column once: text fields once per distinct value, numbers in one vectorized pass
+    county = map_unique(combined_df["county"], lambda value: as_text(canonicalize_county_name(value)))
+    votes = combined_df["votes"]
+    if not pd.api.types.is_numeric_dtype(votes):
+        votes = pd.to_numeric(votes.astype(str).str.replace(",", "", regex=False), errors="coerce")
+    year = pd.to_numeric(combined_df["year"], errors="coerce")
+    valid = (county != "") & year.notna()
+    combined_df = combined_df[valid]
+
+    # Normalize the remaining text fields once per distinct value, then filter with vectorized masks
+    rows = pd.DataFrame({
+        "year": year[valid].astype(int),
+        "county": county[valid],
+        "office": map_unique(combined_df["office"], as_text),
+        "district": map_unique(combined_df["district"], as_text).where(combined_df["district"].notna(), ""),
+        "candidate": map_unique(combined_df["candidate"], lambda value: as_text(value).title()),
+        "party": map_unique(combined_df["party"], as_text),
+        "votes": votes[valid].fillna(0).astype(int),
+    })
+    keep = (
+        ~rows["candidate"].isin(SKIP_CANDIDATES)
+        & (rows["party"] != "")
+    )
+    rows = rows[keep].reset_index(drop=True)
+    rows["bucket"] = map_unique(rows["party"], party_bucket)
+    rows["contest_key"] = np.where(rows["district"] == "", rows["office"], rows["office"] + " - " + rows["district"])
+
+    # Number each (year, office, contest, county) group in order of first appearance,
+    # hashing small category codes rather than the strings themselves
+    group_cols = ["year", "office", "contest_key", "county"]
+    to_categories(rows, ["office", "contest_key", "county"])
+    rows["group"] = rows.groupby(group_cols, sort=False).ngroup()
+    groups = rows.loc[~rows["group"].duplicated(), group_cols].reset_index(drop=True)
+
+    # Vote totals and each bucket's leading row come out of one groupby
+    stats = (
+        rows.groupby(["group", "bucket"])["votes"].agg(["sum", "max", "idxmax"])
+        .unstack("bucket", fill_value=0)
+        .reindex(index=groups.index, columns=pd.MultiIndex.from_product([["sum", "max", "idxmax"], BUCKETS]), fill_value=0)
     )
+    bucket_votes = stats["sum"]
+    dem = bucket_votes["dem"].to_numpy()
+    rep = bucket_votes["rep"].to_numpy()
+    other = bucket_votes["other"].to_numpy()
+    total = dem + rep + other
+    raw_pct = np.abs(dem - rep) / np.where(total > 0, total, 1) * 100
+    # Python's round keeps the two-decimal values identical to the per-county calculation
+    # (and an empty county's margin stays the integer 0)
+    margin_pct = [round(pct, 2) if votes else 0 for pct, votes in zip(raw_pct.tolist(), total.tolist())]
+    groups["margin_pct"] = pd.Series(margin_pct, index=groups.index, dtype=object)
+    groups["winner"] = np.select([dem > rep, rep > dem], ["DEM", "REP"], "TIE")
+    groups["category"], groups["code"], groups["color"] = get_competitiveness(np.array(margin_pct, dtype=float), groups["winner"].to_numpy())
+    # Intern the repeated labels so every county record shares one string object per value
+    for col in ["winner", "category", "code", "color"]:
+        groups[col] = map_unique(groups[col], sys.intern)
+    groups["dem_votes"] = dem
+    groups["rep_votes"] = rep
+    groups["other_votes"] = other
+    groups["total_votes"] = total
+    groups["two_party_total"] = dem + rep
+    groups["margin"] = dem - rep
+
+    # Candidate on the first row with the bucket's highest count (blank when that count is zero)
+    candidates = rows["candidate"].to_numpy()
+    for bucket in ["dem", "rep"]:
+        leader = candidates[stats["idxmax"][bucket].to_numpy()]
+        groups[f"{bucket}_candidate"] = pd.Series(np.where(stats["max"][bucket].to_numpy() > 0, leader, ""), index=groups.index, dtype=object)
+    groups["contest_name"] = map_unique(groups["office"], get_contest_name)
+
+    # Collect county records under one flat (year, office, contest_key) key, then nest them once per contest
+    contest_results = defaultdict(dict)
+    for g in groups.itertuples(index=False):
+        all_parties = {}
+        if g.dem_votes > 0:
+            all_parties["DEM"] = g.dem_votes
+        if g.rep_votes > 0:
+            all_parties["REP"] = g.rep_votes
+        if g.other_votes > 0:
+            all_parties["OTHER"] = g.other_votes
+
+        contest_results[g.year, g.office, g.contest_key][g.county] = {
+            "contest_name": g.contest_name,
+            "year": g.year,
+            "county": g.county,
+            "dem_votes": g.dem_votes,
+            "rep_votes": g.rep_votes,
+            "other_votes": g.other_votes,
+            "total_votes": g.total_votes,
+            "two_party_total": g.two_party_total,
+            "dem_candidate": g.dem_candidate,
+            "rep_candidate": g.rep_candidate,
+            "winner": g.winner,
+            "margin": g.margin,
+            "margin_pct": g.margin_pct,
+            "competitiveness": {
+                "category": g.category,
+                "party": g.winner,
+                "code": g.code,
+                "color": g.color,
+            },
+            "all_parties": all_parties,
+        }
+
+    results_by_year = {}
+    for (year, office, contest_key), results in contest_results.items():
+        results_by_year.setdefault(str(year), {}).setdefault(office, {})[contest_key] = {"results": results}
 
-    bucket = party_bucket(party)
-    if bucket == "dem":
-        county_results["dem_votes"] += votes
-        if votes > county_results.get("_dem_max", 0):
-            county_results["_dem_max"] = votes
-            county_results["dem_candidate"] = candidate
-    elif bucket == "rep":
-        county_results["rep_votes"] += votes
-        if votes > county_results.get("_rep_max", 0):
-            county_results["_rep_max"] = votes
-            county_results["rep_candidate"] = candidate
+    output = {"results_by_year": results_by_year}
+    if ORJSON_AVAILABLE:
+        # orjson encodes straight to UTF-8 bytes with the same two-space layout
+        output_file.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
     else:
-        county_results["other_votes"] += votes
-
-    county_results["total_votes"] += votes
-
-# Finalize margins
-for year_data in results_by_year.values():
-    for contests in year_data.values():
-        for contest in contests.values():
-            for county, data in contest["results"].items():
-                dem = data["dem_votes"]
-                rep = data["rep_votes"]
-                other = data["other_votes"]
-                total = data["total_votes"]
-                
-                two_party_total = dem + rep
-                data["two_party_total"] = two_party_total
-                
-                all_parties = {}
-                if dem > 0:
-                    all_parties["DEM"] = dem
-                if rep > 0:
-                    all_parties["REP"] = rep
-                if other > 0:
-                    all_parties["OTHER"] = other
-                data["all_parties"] = all_parties
-                
-                margin = dem - rep
-                data["margin"] = margin
-                data["margin_pct"] = round((abs(margin) / total) * 100, 2) if total else 0
-                
-                if dem > rep:
-                    data["winner"] = "DEM"
-                    data["competitiveness"] = get_competitiveness(data["margin_pct"], "DEM")
-                elif rep > dem:
-                    data["winner"] = "REP"
-                    data["competitiveness"] = get_competitiveness(data["margin_pct"], "REP")
-                else:
-                    data["winner"] = "TIE"
-                    data["competitiveness"] = {
-                        "category": "Tossup",
-                        "party": "TIE",
-                        "code": "TIE_TOSSUP",
-                        "color": "#f7f7f7"
-                    }
-
-                data.pop("_dem_max", None)
-                data.pop("_rep_max", None)
-
-output = {"results_by_year": results_by_year}
-output_file.write_text(json.dumps(output, indent=2))
-
-print("=" * 80)
-print("KY RESULTS JSON BUILT (CSV + TXT)")
-print("=" * 80)
-print(f"Years: {sorted(results_by_year.keys())}")
-print(f"Saved: {output_file}")
+        # Stream the encoder's chunks to disk instead of building the whole document as one string
+        with output_file.open("w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+
+    print("=" * 80)
+    print("KY RESULTS JSON BUILT (CSV + TXT)")
+    print("=" * 80)
+    print(f"Years: {sorted(results_by_year.keys())}")
+    print(f"Saved: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import pdfplumber
 
-pdf = pdfplumber.open('data/Certification of Election Results for 2023 General Election Final.pdf')
+PDF_PATH = 'data/Certification of Election Results for 2023 General Election Final.pdf'
 
 races = {
     'Governor': 1,
@@ -11,19 +13,32 @@ races = {
     'Ag Commissioner': 32
 }
 
-for race, page_num in races.items():
-    text = pdf.pages[page_num].extract_text()
-    lines = text.split('\n')
-    
-    print(f'\n=== {race} (Page {page_num+1}) ===')
-    for line in lines[:15]:
-        print(line)
-    print()
-    
-    # Show first data line
-    for line in lines:
-        if 'Adair' in line:
-            print(f'Data format: {line}')
-            break
-
-pdf.close()
+
+def extract_page_text(page_num):
+    # Each worker opens its own handle; a pdfplumber document can't be shared between workers
+    with pdfplumber.open(PDF_PATH) as pdf:
+        return pdf.pages[page_num].extract_text()
+
+
+def main():
+    # Page layout analysis is pure Python, so the pages are extracted in separate processes
+    with ProcessPoolExecutor(max_workers=len(races)) as executor:
+        texts = list(executor.map(extract_page_text, races.values()))
+
+    for (race, page_num), text in zip(races.items(), texts):
+        lines = text.split('\n')
+        
+        print(f'\n=== {race} (Page {page_num+1}) ===')
+        for line in lines[:15]:
+            print(line)
+        print()
+        
+        # Show first data line
+        for line in lines:
+            if 'Adair' in line:
+                print(f'Data format: {line}')
+                break
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Summarize the two 2024 county result files in one pass.
+Reads each file once and derives the office, candidate and duplicate reports
+from the same grouped totals.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from csv_utils import read_csv, read_csv_sample
+
+data_dir = Path("c:/Users/Shama/OneDrive/Documents/Course_Materials/CPT-236/Side_Projects/KYRealignments/data")
+county_files = [
+    data_dir / "20241105__ky__general__county.csv",
+    data_dir / "20241106__ky__general__county.csv",
+]
+precinct_file = data_dir / "20241105__ky__general__precinct.csv"
+
+COLUMNS = ["county", "office", "candidate", "votes"]
+TRUMP = "Donald J Trump"
+PRESIDENT_OFFICE = "President and Vice President of the United States"
+
+for path in county_files:
+    df = read_csv(path, columns=COLUMNS, categories=["candidate"])
+    candidates = df["candidate"].unique()
+    candidate_votes = df.groupby("candidate", observed=True)["votes"].sum()
+    has_office = "office" in df.columns
+    if has_office:
+        trump_by_office = df[df["candidate"] == TRUMP].groupby("office")["votes"].sum()
+
+    print("=" * 80)
+    print(f"FILE: {path.name}")
+    print("=" * 80)
+    print(f"  Records: {len(df)}")
+    print(f"  Total votes: {df['votes'].sum():,}")
+    print(f"  Unique candidates: {len(candidates)}")
+    print(f"  Unique counties: {df['county'].nunique()}")
+    if has_office:
+        print(f"  Offices: {df['office'].nunique()}")
+        print(f"  Office samples: {list(df['office'].unique()[:5])}")
+        print(f"  Trump Presidential votes: {trump_by_office.get('President', 0):,}")
+
+        print("\nTrump for ANY office:")
+        print(trump_by_office.to_string())
+    else:
+        print("  NO OFFICE COLUMN")
+
+    print("\nAll candidates (first 20):")
+    print(list(candidates[:20]))
+
+    print("\nCandidates that might be Trump:")
+    for cand in candidates:
+        if 'trump' in str(cand).lower() or 'donald' in str(cand).lower():
+            print(f"  {cand}: {candidate_votes[cand]:,}")
+
+    if has_office:
+        pres_df = df[df["office"] == PRESIDENT_OFFICE]
+        print("\nPresident candidates:")
+        if len(pres_df) > 0:
+            print(list(pres_df["candidate"].unique()[:10]))
+            print(f"Total records for President: {len(pres_df)}")
+        else:
+            print("No President records")
+
+    print("\nCandidate vote totals (top 10):")
+    for name, votes in candidate_votes.nlargest(10).items():
+        print(f"  {name:30} {votes:>12,}")
+
+    # Fold (county, candidate) into one int64 key so duplicated hashes a single column
+    county_codes, county_uniques = pd.factorize(df["county"], use_na_sentinel=False)
+    candidate_codes, _ = pd.factorize(df["candidate"], use_na_sentinel=False)
+    pair_key = pd.Series(candidate_codes.astype("int64") * len(county_uniques) + county_codes)
+    dups = df[pair_key.duplicated(keep=False).to_numpy()]
+    print(f"\nDuplicate county/candidate: {len(dups)}")
+    if len(dups) > 0:
+        print("\nSample duplicates:")
+        print(dups[["county", "candidate", "votes"]].astype({"candidate": str}).sort_values(["candidate", "county"]).head(20).to_string())
+    print()
+
+print("=" * 80)
+print("PRECINCT FILE check:")
+df_precinct = read_csv_sample(precinct_file, 5)
+print(f"Precinct file shape (first 5): {df_precinct.shape}")
+print(f"Precinct columns: {list(df_precinct.columns)}")
@@ -56,15 +56,21 @@ presidential_candidates = [
     'John F. Kerry', 'Al Gore'
 ]
 
-df_pres = df_final[df_final['candidate'].isin(presidential_candidates)]
+PRES_CANDIDATES = frozenset(presidential_candidates)
+
+# Match against the category codes so each distinct name is tested once
+df_final['candidate'] = df_final['candidate'].astype('category')
+df_pres = df_final[df_final['candidate'].isin(PRES_CANDIDATES)]
 print(f"\nFiltered to known presidential candidates: {len(df_pres):,} records")
 print(f"Total votes: {df_pres['votes'].sum():,.0f}")
 
-trump_filtered = df_pres[df_pres['candidate'].str.contains('Trump', case=False, na=False)]['votes'].sum()
+# Scan the candidate names once and reuse the Trump rows for both totals
+trump_df = df_pres[df_pres['candidate'].str.contains('Trump', case=False, na=False)]
+trump_filtered = trump_df['votes'].sum()
 print(f"Trump total: {trump_filtered:,.0f}")
 
 # By year
 print(f"\nTrump by year (filtered to known presidential candidates):")
-trump_by_year = df_pres[df_pres['candidate'].str.contains('Trump', case=False, na=False)].groupby('year')['votes'].sum()
+trump_by_year = trump_df.groupby('year')['votes'].sum()
 for year, votes in trump_by_year.items():
     print(f"  {year}: {votes:>12,.0f}")
@@ -5,7 +5,11 @@ Removes headers, corrupted entries, and standardizes formats.
 
 import pandas as pd
 from pathlib import Path
-import re
+
+from csv_utils import read_csv
+
+# Parsed straight to category dtype; the .str filters below then scan each distinct value once
+TEXT_COLUMNS = ['candidate', 'county', 'party', 'office']
 
 print("=" * 80)
 print("ELECTION DATA CLEANING & VALIDATION")
@@ -18,7 +22,7 @@ if not master_file.exists():
     exit(1)
 
 print(f"\nLoading: {master_file}")
-df = pd.read_csv(master_file)
+df = read_csv(master_file, categories=TEXT_COLUMNS)
 
 print(f"Original size: {len(df):,} rows")
 
@@ -33,12 +37,14 @@ header_patterns = [
     'Certified Results', 'Commonwealth of Kentucky', 'Official',
     'For the office of', 'Alison Lundergan Grimes, Secretary'
 ]
+header_regex = '|'.join(f'(?:{p})' for p in header_patterns)
 
-rows_before = len(df)
-for pattern in header_patterns:
-    df = df[~df['candidate'].str.contains(pattern, na=False, case=False)]
+# Steps 1-5 only mark rows to drop; the frame is sliced once in Step 5
+candidates = df['candidate']
+removed = candidates.str.contains(header_regex, na=False, case=False)
+keep = ~removed
 
-print(f"Removed {rows_before - len(df):,} header rows")
+print(f"Removed {removed.sum():,} header rows")
 
 # Step 2: Remove generic candidate names
 print("\n" + "="*80)
@@ -51,12 +57,12 @@ generic_patterns = [
     r'^[A-Z]$',
     r'^blank|write.?in|scattered|overvote|undervote',
 ]
+generic_regex = '|'.join(f'(?:{p})' for p in generic_patterns)
 
-rows_before = len(df)
-for pattern in generic_patterns:
-    df = df[~df['candidate'].str.match(pattern, na=False, case=False)]
+removed = keep & candidates.str.match(generic_regex, na=False, case=False)
+keep &= ~removed
 
-print(f"Removed {rows_before - len(df):,} generic candidate rows")
+print(f"Removed {removed.sum():,} generic candidate rows")
 
 # Step 3: Remove malformed candidate names (VP tickets, symbols, etc)
 print("\n" + "="*80)
@@ -70,12 +76,13 @@ malformed_patterns = [
     r'&.*Edwards', # Kerry & Edwards
     r'[^\w\s\'\-\.]',  # Remove entries with special characters (except apostrophes, hyphens, dots)
 ]
+# Skip the last one for now
+malformed_regex = '|'.join(f'(?:{p})' for p in malformed_patterns[:-1])
 
-rows_before = len(df)
-for pattern in malformed_patterns[:-1]:  # Skip the last one for now
-    df = df[~df['candidate'].str.contains(pattern, na=False, case=False, regex=True)]
+removed = keep & candidates.str.contains(malformed_regex, na=False, case=False)
+keep &= ~removed
 
-print(f"Removed {rows_before - len(df):,} malformed entries")
+print(f"Removed {removed.sum():,} malformed entries")
 
 # Step 4: Fix unrealistic vote counts
 print("\n" + "="*80)
@@ -86,15 +93,24 @@ print("="*80)
 # (Kentucky's largest county is Jefferson with ~700k people)
 max_reasonable = 250000
 
-rows_before = len(df)
-df = df[(df['votes'] <= max_reasonable) | (df['votes'].isna())]
-print(f"Removed {rows_before - len(df):,} entries with unrealistic vote counts (>{max_reasonable:,})")
+# With NumPy bools, pandas.eval hands the vote checks to numexpr in one pass when it is installed
+keep = keep.astype(bool)
+votes = pd.to_numeric(df['votes'], errors='coerce')
+removed = pd.eval('keep & (votes > max_reasonable)')
+keep &= ~removed
+print(f"Removed {removed.sum():,} entries with unrealistic vote counts (>{max_reasonable:,})")
 
 # Step 5: Standardize and normalize
 print("\n" + "="*80)
 print("STEP 5: STANDARDIZATION")
 print("="*80)
 
+# Remove rows with missing critical data (only keep rows with at least 1 vote)
+missing = df['county'].isna() | df['candidate'].isna()
+removed = pd.eval('keep & (missing | ~(votes > 0))')
+keep &= ~removed
+df = df.loc[keep].copy()
+
 # Trim whitespace
 df['candidate'] = df['candidate'].str.strip()
 df['county'] = df['county'].str.strip()
@@ -102,13 +118,8 @@ df['party'] = df['party'].str.strip()
 df['office'] = df['office'].str.strip()
 
 # Convert votes to integer
-df['votes'] = pd.to_numeric(df['votes'], errors='coerce').fillna(0).astype(int)
-
-# Remove rows with missing critical data
-rows_before = len(df)
-df = df.dropna(subset=['county', 'candidate', 'votes'])
-df = df[df['votes'] > 0]  # Only keep rows with at least 1 vote
-print(f"Removed {rows_before - len(df):,} incomplete rows")
+df['votes'] = votes.loc[keep].astype(int)
+print(f"Removed {removed.sum():,} incomplete rows")
 
 # Step 6: Quality checks
 print("\n" + "="*80)
@@ -13,6 +13,9 @@ Example:
 
 import sys
 import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 import re
 
@@ -34,37 +37,60 @@ except ImportError:
     print("Error: Could not import tools/pdf_to_csv.py")
     sys.exit(1)
 
+NON_KEY_CHARS_RE = re.compile(r"[^A-Za-z0-9 .-]")
+WHITESPACE_RE = re.compile(r"\s+")
+COUNTY_SUFFIX_RE = re.compile(r"\s+COUNTY$")
+DISTRICT_RES = [
+    re.compile(r"(\d+)(?:st|nd|rd|th)\s+Congressional District", re.IGNORECASE),
+    re.compile(r"(\d+)(?:st|nd|rd|th)\s+Senatorial District", re.IGNORECASE),
+    re.compile(r"(\d+)(?:st|nd|rd|th)\s+Representative District", re.IGNORECASE),
+]
+OFFICE_HEADER_RE = re.compile(r"^(.*?)\s*-\s*\(Vote for", re.IGNORECASE)
+PERCENT_TOKEN_RE = re.compile(r"\d+\.\d+%")
+LETTER_RE = re.compile(r"[A-Za-z]")
+
+COUNTY_LOOKUP_PATH = Path(__file__).resolve().parent.parent / "data" / "county_name_lookup.csv"
+PDF_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "pdf_cache"
+# Bump whenever the parsers change so cached results are not reused
+PARSER_VERSION = 1
+
 
 def normalize_county_key(text: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9 .-]", "", str(text or ""))
-    value = re.sub(r"\s+", " ", value).strip().upper()
+    value = NON_KEY_CHARS_RE.sub("", str(text or ""))
+    value = WHITESPACE_RE.sub(" ", value).strip().upper()
     return value
 
 
+def normalize_county_keys(values: pd.Series) -> pd.Series:
+    """Vectorized normalize_county_key for a Series of strings."""
+    # Pattern strings rather than compiled patterns keep pandas on its Arrow string kernels
+    values = values.str.replace(NON_KEY_CHARS_RE.pattern, "", regex=True)
+    return values.str.replace(WHITESPACE_RE.pattern, " ", regex=True).str.strip().str.upper()
+
+
 def load_county_lookup() -> dict:
-    lookup_path = Path(__file__).resolve().parent.parent / "data" / "county_name_lookup.csv"
+    lookup_path = COUNTY_LOOKUP_PATH
     if not lookup_path.exists():
         print(f"Warning: county lookup not found at {lookup_path}")
         return {}
 
-    county_map = {}
     df = pd.read_csv(lookup_path, dtype=str).fillna("")
-    for _, row in df.iterrows():
-        canonical = str(row.get("county_name", "")).strip()
-        if not canonical:
-            continue
-        keys = {
-            normalize_county_key(canonical),
-            normalize_county_key(row.get("county_namelsad", "")),
-            normalize_county_key(row.get("match_key_normalized", "")),
-        }
-        no_suffix = re.sub(r"\s+COUNTY$", "", normalize_county_key(canonical))
-        if no_suffix:
-            keys.add(no_suffix)
-        for key in keys:
-            if key:
-                county_map[key] = canonical
-    return county_map
+    df = df.reindex(columns=["county_name", "county_namelsad", "match_key_normalized"], fill_value="")
+    df["county_name"] = df["county_name"].str.strip()
+    df = df[df["county_name"] != ""]
+    canonical = df["county_name"]
+
+    name_keys = normalize_county_keys(canonical)
+    key_columns = [
+        name_keys,
+        normalize_county_keys(df["county_namelsad"]),
+        normalize_county_keys(df["match_key_normalized"]),
+        name_keys.str.replace(COUNTY_SUFFIX_RE.pattern, "", regex=True),
+    ]
+    # Flatten row by row so later rows still win any key collision
+    keys = pd.concat(key_columns, axis=1).to_numpy().ravel()
+    canonicals = canonical.repeat(len(key_columns)).to_numpy()
+    return {key: name for key, name in zip(keys, canonicals) if key}
 
 
 COUNTY_LOOKUP = load_county_lookup()
@@ -76,31 +102,59 @@ def canonicalize_county_name(raw_county: str) -> str:
         return ""
     if key in COUNTY_LOOKUP:
         return COUNTY_LOOKUP[key]
-    no_suffix = re.sub(r"\s+COUNTY$", "", key)
+    no_suffix = COUNTY_SUFFIX_RE.sub("", key)
     if no_suffix in COUNTY_LOOKUP:
         return COUNTY_LOOKUP[no_suffix]
     return str(raw_county).strip().title()
 
 
+def canonicalize_county_names(values: pd.Series) -> pd.Series:
+    """canonicalize_county_name over a Series, computed once per distinct value."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    canonical = pd.Series([canonicalize_county_name(value) for value in uniques], dtype=object)
+    return pd.Series(canonical.to_numpy()[codes], index=values.index, dtype=object)
+
+
 def infer_county_from_pdf_name(pdf_path: str) -> str:
     stem = Path(pdf_path).stem
-    cleaned = re.sub(r"\s+", " ", stem).strip()
+    cleaned = WHITESPACE_RE.sub(" ", stem).strip()
     return canonicalize_county_name(cleaned)
 
 
 def extract_district_from_office(office_text: str) -> str:
-    patterns = [
-        r"(\d+)(?:st|nd|rd|th)\s+Congressional District",
-        r"(\d+)(?:st|nd|rd|th)\s+Senatorial District",
-        r"(\d+)(?:st|nd|rd|th)\s+Representative District",
-    ]
-    for pattern in patterns:
-        m = re.search(pattern, office_text, re.IGNORECASE)
+    for pattern in DISTRICT_RES:
+        m = pattern.search(office_text)
         if m:
             return m.group(1)
     return ""
 
 
+PAGE_TEXT_CACHE = {}
+
+
+def extract_page_texts(pdf_path: str, max_pages=None) -> list:
+    """
+    Return the text of a PDF's first max_pages pages (all pages when None).
+    Pages are extracted at most once, so the recap check and the parser share the work;
+    only the most recent PDF is kept.
+    """
+    cached = PAGE_TEXT_CACHE.get(pdf_path)
+    if cached is not None:
+        complete, texts = cached
+        if complete or (max_pages is not None and len(texts) >= max_pages):
+            return texts[:max_pages]
+    else:
+        PAGE_TEXT_CACHE.clear()
+        texts = []
+
+    with pdfplumber.open(pdf_path) as pdf:
+        pages = pdf.pages[:max_pages]
+        texts = texts + [(page.extract_text() or "") for page in pages[len(texts):]]
+        complete = len(pages) == len(pdf.pages)
+    PAGE_TEXT_CACHE[pdf_path] = (complete, texts)
+    return texts
+
+
 def parse_sos_precinct_recap_pdf(pdf_path: str, election_date: str) -> pd.DataFrame:
     """
     Parse SOS precinct recap PDFs (e.g. 2022_recaps/*.pdf) by reading text lines and
@@ -127,79 +181,78 @@ def parse_sos_precinct_recap_pdf(pdf_path: str, election_date: str) -> pd.DataFr
     )
     party_tokens = {"REP", "DEM", "LIB", "IND", "GRN", "CON", "W", "(W)"}
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            for raw_line in text.splitlines():
-                line = re.sub(r"\s+", " ", raw_line).strip()
-                if not line:
-                    continue
-
-                if any(line.startswith(prefix) for prefix in skip_prefixes):
-                    continue
-
-                # Detect contest header lines
-                office_match = re.match(r"^(.*?)\s*-\s*\(Vote for", line, flags=re.IGNORECASE)
-                if office_match:
-                    current_office = office_match.group(1).strip()
-                    current_district = extract_district_from_office(current_office)
-                    continue
-
-                if not current_office:
-                    continue
-
-                # Must end in percent to be a candidate line in this SOS format
-                tokens = line.split()
-                if len(tokens) < 5 or not re.fullmatch(r"\d+\.\d+%", tokens[-1]):
-                    continue
-
-                # Total votes is the rightmost integer token before final percentage.
-                total_votes = None
-                for tok in reversed(tokens[:-1]):
-                    if re.fullmatch(r"\d[\d,]*", tok):
-                        total_votes = int(tok.replace(",", ""))
-                        break
-                if total_votes is None:
-                    continue
-
-                # Candidate + party section is before first numeric token.
-                first_numeric_idx = None
-                for i, tok in enumerate(tokens):
-                    if re.fullmatch(r"\d[\d,]*", tok):
-                        first_numeric_idx = i
-                        break
-                if first_numeric_idx is None or first_numeric_idx < 2:
-                    continue
-
-                cand_party_tokens = tokens[:first_numeric_idx]
-
-                party = ""
-                party_idx = None
-                for i, tok in enumerate(cand_party_tokens):
-                    if tok in party_tokens:
-                        party_idx = i
-                        party = tok
-                        break
-                if party_idx is None:
-                    # Skip lines that don't look like candidate vote lines.
-                    continue
-
-                candidate = " ".join(cand_party_tokens[:party_idx]).strip()
-                if not candidate:
-                    continue
-
-                if party == "(W)":
-                    party = "W"
-
-                rows.append({
-                    "county": county,
-                    "office": current_office,
-                    "district": current_district,
-                    "candidate": candidate,
-                    "party": party,
-                    "votes": total_votes,
-                    "year": year,
-                })
+    for text in extract_page_texts(pdf_path):
+        for raw_line in text.splitlines():
+            tokens = raw_line.split()
+            if not tokens:
+                continue
+            line = " ".join(tokens)
+
+            if line.startswith(skip_prefixes):
+                continue
+
+            # Detect contest header lines
+            office_match = OFFICE_HEADER_RE.match(line)
+            if office_match:
+                current_office = office_match.group(1).strip()
+                current_district = extract_district_from_office(current_office)
+                continue
+
+            if not current_office:
+                continue
+
+            # Must end in percent to be a candidate line in this SOS format
+            if len(tokens) < 5 or not PERCENT_TOKEN_RE.fullmatch(tokens[-1]):
+                continue
+
+            # Integer tokens are digits with optional thousands commas.
+            # Total votes is the rightmost integer token before final percentage.
+            total_votes = None
+            for tok in reversed(tokens[:-1]):
+                if tok[0].isdecimal() and tok.replace(",", "").isdecimal():
+                    total_votes = int(tok.replace(",", ""))
+                    break
+            if total_votes is None:
+                continue
+
+            # Candidate + party section is before first numeric token.
+            first_numeric_idx = None
+            for i, tok in enumerate(tokens):
+                if tok[0].isdecimal() and tok.replace(",", "").isdecimal():
+                    first_numeric_idx = i
+                    break
+            if first_numeric_idx is None or first_numeric_idx < 2:
+                continue
+
+            cand_party_tokens = tokens[:first_numeric_idx]
+
+            party = ""
+            party_idx = None
+            for i, tok in enumerate(cand_party_tokens):
+                if tok in party_tokens:
+                    party_idx = i
+                    party = tok
+                    break
+            if party_idx is None:
+                # Skip lines that don't look like candidate vote lines.
+                continue
+
+            candidate = " ".join(cand_party_tokens[:party_idx]).strip()
+            if not candidate:
+                continue
+
+            if party == "(W)":
+                party = "W"
+
+            rows.append({
+                "county": county,
+                "office": current_office,
+                "district": current_district,
+                "candidate": candidate,
+                "party": party,
+                "votes": total_votes,
+                "year": year,
+            })
 
     if not rows:
         return pd.DataFrame()
@@ -216,8 +269,7 @@ def is_sos_precinct_recap(pdf_path: str) -> bool:
         return True
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            sample = "\n".join((page.extract_text() or "") for page in pdf.pages[:2])
+        sample = "\n".join(extract_page_texts(pdf_path, 2))
         return (
             "Precinct Results Report" in sample
             and "OFFICIAL BALLOT FOR" in sample
@@ -254,7 +306,7 @@ def pdf_to_openelections(pdf_path: str, election_date: str, level: str = 'county
         return False
 
     if "county" in df.columns:
-        df["county"] = df["county"].map(canonicalize_county_name)
+        df["county"] = canonicalize_county_names(df["county"])
     else:
         df["county"] = ""
 
@@ -263,7 +315,7 @@ def pdf_to_openelections(pdf_path: str, election_date: str, level: str = 'county
         if df["county"].eq("").all():
             df["county"] = inferred_county
         else:
-            alpha_ratio = df["county"].astype(str).str.contains(r"[A-Za-z]", regex=True).mean()
+            alpha_ratio = df["county"].astype(str).str.contains(LETTER_RE).mean()
             if alpha_ratio < 0.3:
                 df["county"] = inferred_county
 
@@ -308,6 +360,58 @@ def pdf_to_openelections(pdf_path: str, election_date: str, level: str = 'county
     return True
 
 
+def parse_directory_pdf(pdf_path: str, election_date: str) -> pd.DataFrame:
+    """Parse one PDF of a directory batch; runs in a worker process."""
+    if is_sos_precinct_recap(pdf_path):
+        return parse_sos_precinct_recap_pdf(pdf_path, election_date)
+
+    df = parse_ky_pdf_tabula(pdf_path)
+    if df.empty:
+        return df
+    if "county" in df.columns:
+        df["county"] = canonicalize_county_names(df["county"])
+    else:
+        df["county"] = infer_county_from_pdf_name(pdf_path)
+
+    # Aggregate in the worker, as the SOS parser does, so the merge only sees one row per candidate
+    df["votes"] = pd.to_numeric(df["votes"], errors="coerce").fillna(0).astype(int)
+    group_cols = ["county", "office", "district", "candidate", "party", "year"]
+    return df.groupby(group_cols, as_index=False, dropna=False)["votes"].sum()
+
+
+def cached_parse_directory_pdf(pdf_path: str, election_date: str) -> pd.DataFrame:
+    """
+    parse_directory_pdf, reusing a pickled result from PDF_CACHE_DIR while the PDF
+    is unchanged on disk (same path, size and modification time) and the county
+    lookup used to canonicalize its county names has not changed either.
+    """
+    stat = os.stat(pdf_path)
+    try:
+        lookup_mtime_ns = COUNTY_LOOKUP_PATH.stat().st_mtime_ns
+    except OSError:
+        lookup_mtime_ns = 0
+    key = f"{pdf_path}:{stat.st_mtime_ns}:{stat.st_size}:{election_date}:{lookup_mtime_ns}:{PARSER_VERSION}"
+    cache_path = PDF_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+    try:
+        return pd.read_pickle(cache_path)
+    except Exception:
+        # Missing, truncated or written by another pandas version: parse the PDF again
+        pass
+
+    df = parse_directory_pdf(pdf_path, election_date)
+    # An empty result may be a parse failure (e.g. tabula without Java), so retry it next run
+    if df.empty:
+        return df
+    try:
+        PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return df
+
+
 def directory_to_openelections(pdf_dir: str, election_date: str, level: str = "county"):
     """
     Convert all PDFs in a directory and merge into one OpenElections county CSV.
@@ -323,20 +427,14 @@ def directory_to_openelections(pdf_dir: str, election_date: str, level: str = "c
     print(f"PDF files: {len(pdf_paths)}")
     print()
 
+    # Each PDF parses independently, so spread them over worker processes
     all_frames = []
-    for i, pdf in enumerate(pdf_paths, 1):
-        print(f"[{i}/{len(pdf_paths)}] {pdf.name}")
-        if is_sos_precinct_recap(str(pdf)):
-            df = parse_sos_precinct_recap_pdf(str(pdf), election_date)
-        else:
-            df = parse_ky_pdf_tabula(str(pdf))
-            if "county" in df.columns:
-                df["county"] = df["county"].map(canonicalize_county_name)
-            else:
-                df["county"] = infer_county_from_pdf_name(str(pdf))
-
-        if not df.empty:
-            all_frames.append(df)
+    with ProcessPoolExecutor(max_workers=min(len(pdf_paths), os.cpu_count() or 1)) as executor:
+        frames = executor.map(cached_parse_directory_pdf, [str(pdf) for pdf in pdf_paths], repeat(election_date))
+        for i, (pdf, df) in enumerate(zip(pdf_paths, frames), 1):
+            print(f"[{i}/{len(pdf_paths)}] {pdf.name}")
+            if not df.empty:
+                all_frames.append(df)
 
     if not all_frames:
         print("Warning: No rows extracted from directory PDFs.")
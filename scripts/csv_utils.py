@@ -0,0 +1,162 @@
+"""
+Shared CSV reading helpers for the OpenElections aggregation scripts.
+Parses with PyArrow's multithreaded reader when pyarrow is installed, otherwise pandas.
+"""
+
+import csv
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def normalize_columns(df):
+    """Lower-case and strip column names in place"""
+    df.columns = [col.lower().strip() for col in df.columns]
+    return df
+
+
+def read_header(path):
+    """Return the raw column names from a CSV's first line"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return next(csv.reader(f), [])
+
+
+def _raw_columns(header, columns):
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return [col for col in header if col.lower().strip() in wanted]
+
+
+def _read_part(path, columns, categories):
+    # Returns an Arrow table when pyarrow is installed, otherwise a DataFrame
+    header = read_header(path) if columns is not None or categories else []
+    include = _raw_columns(header, columns)
+    category_cols = _raw_columns(header, categories or [])
+
+    if not PYARROW_AVAILABLE:
+        dtype = {col: "category" for col in category_cols} or None
+        return normalize_columns(pd.read_csv(path, usecols=include, dtype=dtype))
+
+    # Treat empty string fields as missing, matching pandas' NaN handling
+    convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+    if include is not None:
+        convert_options.include_columns = include
+    if category_cols:
+        convert_options.column_types = {col: pa.dictionary(pa.int32(), pa.string()) for col in category_cols}
+    table = pacsv.read_csv(path, convert_options=convert_options)
+    return table.rename_columns([col.lower().strip() for col in table.column_names])
+
+
+def read_csv(path, columns=None, categories=None):
+    """
+    Read one CSV into a DataFrame with normalized column names.
+    When columns is given, only those (normalized) columns are parsed;
+    columns named in categories are parsed straight to category dtype.
+    """
+    part = _read_part(path, columns, categories)
+    return part.to_pandas() if PYARROW_AVAILABLE else part
+
+
+def read_csv_parallel(paths, columns=None, categories=None):
+    """
+    Parse several CSVs concurrently; both parsers release the GIL while tokenizing.
+    Returns one completed future per path, in order, so callers can handle read errors per file.
+    """
+    with ThreadPoolExecutor() as executor:
+        return [executor.submit(read_csv, path, columns, categories) for path in paths]
+
+
+def concat_frames(frames, categories=()):
+    """
+    Stack frames, first giving each category column one shared set of categories
+    so pandas keeps it categorical instead of falling back to object.
+    """
+    unshared = []
+    for col in categories:
+        parts = [df[col] for df in frames if col in df and isinstance(df[col].dtype, pd.CategoricalDtype)]
+        if len(parts) != len(frames):
+            continue
+        # An all-blank column comes back with object categories, so give every part string categories
+        parts = [part.cat.set_categories(part.cat.categories.astype(str)) for part in parts]
+        try:
+            shared = union_categoricals(parts, ignore_order=True).categories
+        except TypeError:
+            unshared.append(col)
+            continue
+        for df, part in zip(frames, parts):
+            df[col] = part.cat.set_categories(shared)
+
+    combined = pd.concat(frames, ignore_index=True)
+    for col in unshared:
+        combined[col] = combined[col].astype("category")
+    return combined
+
+
+def read_csv_files(paths, columns=None, on_error=None, categories=None):
+    """
+    Read several CSVs concurrently and stack them into one DataFrame.
+    With on_error set, unreadable files are reported through on_error(path, exc) and skipped;
+    returns None when no file could be read.
+    """
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(_read_part, path, columns, categories) for path in paths]
+
+    parts = []
+    for path, future in zip(paths, futures):
+        try:
+            parts.append(future.result())
+        except Exception as exc:
+            if on_error is None:
+                raise
+            on_error(path, exc)
+
+    if not parts:
+        return None
+    if not PYARROW_AVAILABLE:
+        return concat_frames(parts, categories or ())
+
+    # Stitch the Arrow chunks together without copying, converting to pandas once
+    try:
+        table = pa.concat_tables(parts, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return concat_frames([part.to_pandas() for part in parts], categories or ())
+    return table.to_pandas(self_destruct=True)
+
+
+def read_csv_sample(path, nrows):
+    """
+    Read the first nrows rows of a CSV, keeping the column names as written.
+    PyArrow's streaming reader stops after the first memory-mapped block(s) instead of tokenizing the file.
+    """
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(path, nrows=nrows)
+
+    # Memory-map the file so blocks are parsed straight from the page cache
+    convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+    with pa.memory_map(str(path), "r") as source:
+        reader = pacsv.open_csv(source, read_options=pacsv.ReadOptions(block_size=1 << 20), convert_options=convert_options)
+        batches = []
+        rows = 0
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= nrows:
+                break
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table.slice(0, nrows).to_pandas()
+
+
+def to_categories(df, columns):
+    """Convert string key columns to category dtype so grouping hashes small integer codes"""
+    for col in columns:
+        df[col] = df[col].astype("category")
+    return df
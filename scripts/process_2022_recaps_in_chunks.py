@@ -13,7 +13,7 @@ import pandas as pd
 
 from convert_pdf_to_openelections import (
     parse_sos_precinct_recap_pdf,
-    canonicalize_county_name,
+    canonicalize_county_names,
 )
 
 
@@ -42,7 +42,7 @@ def process_chunk(start: int, count: int):
         df = parse_sos_precinct_recap_pdf(str(pdf), ELECTION_DATE)
         if df.empty:
             continue
-        df["county"] = df["county"].map(canonicalize_county_name)
+        df["county"] = canonicalize_county_names(df["county"])
         rows.append(df)
 
     if not rows:
@@ -74,7 +74,7 @@ def merge_chunks():
     merged = pd.concat(frames, ignore_index=True)
     merged["votes"] = pd.to_numeric(merged["votes"], errors="coerce").fillna(0).astype(int)
     merged["year"] = 2022
-    merged["county"] = merged["county"].map(canonicalize_county_name)
+    merged["county"] = canonicalize_county_names(merged["county"])
 
     merged = (
         merged.groupby(
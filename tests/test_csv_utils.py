@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import csv_utils
+from csv_utils import concat_frames, read_csv_parallel
+
+CATEGORY_COLS = ["county", "party", "office", "district"]
+
+
+@pytest.mark.parametrize("pyarrow_available", [True, False])
+def test_concat_frames_with_all_blank_category_column(tmp_path, monkeypatch, pyarrow_available):
+    if pyarrow_available and not csv_utils.PYARROW_AVAILABLE:
+        pytest.skip("pyarrow not installed")
+    monkeypatch.setattr(csv_utils, "PYARROW_AVAILABLE", pyarrow_available)
+
+    house = tmp_path / "house.csv"
+    house.write_text("county,office,district,candidate,party,votes\nAdair,US House,1,A,REP,5\n")
+    president = tmp_path / "president.csv"
+    president.write_text("county,office,district,candidate,party,votes\nAdair,President,,B,,7\n")
+
+    frames = [read.result() for read in read_csv_parallel([house, president], categories=CATEGORY_COLS)]
+    combined = concat_frames(frames, CATEGORY_COLS)
+
+    assert len(combined) == 2
+    for col in CATEGORY_COLS:
+        assert isinstance(combined[col].dtype, pd.CategoricalDtype)
+    assert combined["district"].tolist()[0] == "1"
+    assert pd.isna(combined["district"].tolist()[1])
+    assert pd.isna(combined["party"].tolist()[1])
+    assert combined["office"].tolist() == ["US House", "President"]
+
@@ -0,0 +1,95 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ky_data
+from ky_data import iter_county_margins, rewrite_result_keys
+
+
+def election_json(results, indent=2):
+    data = {'results_by_year': {'2020': {'President': {'contest': {'contest_name': 'LARU', 'results': results}}}}}
+    return json.dumps(data, indent=indent)
+
+
+def contest_results(text):
+    return json.loads(text)['results_by_year']['2020']['President']['contest']['results']
+
+
+def test_rename_replaces_existing_good_key():
+    text = election_json({'Larue': {'votes': 1}, 'Adair': {'votes': 2}, 'LARU': {'votes': 3}})
+
+    text, renamed, _ = rewrite_result_keys(text, {'LARU': 'Larue'})
+
+    assert renamed == 1
+    assert text.count('"Larue"') == 1
+    assert contest_results(text) == {'Adair': {'votes': 2}, 'Larue': {'votes': 3}}
+
+
+def test_rename_last_duplicate_wins_in_compact_json():
+    text = election_json({'MCCK': {'votes': 1}, 'Mccracken': {'votes': 2}, 'Adair': {'votes': 3}}, indent=None)
+
+    text, renamed, _ = rewrite_result_keys(text, {'MCCK': 'McCracken', 'Mccracken': 'McCracken'})
+
+    assert renamed == 2
+    assert contest_results(text) == {'McCracken': {'votes': 2}, 'Adair': {'votes': 3}}
+
+
+def test_rename_only_touches_results_keys():
+    text = election_json({'LARU': {'LARU': 1}})
+
+    text, renamed, _ = rewrite_result_keys(text, {'LARU': 'Larue'})
+
+    assert renamed == 1
+    data = json.loads(text)
+    assert data['results_by_year']['2020']['President']['contest']['contest_name'] == 'LARU'
+    assert contest_results(text) == {'Larue': {'LARU': 1}}
+
+
+def test_chained_renames_apply_in_key_order():
+    text = election_json({'A': 1, 'B': 2})
+
+    text, renamed, _ = rewrite_result_keys(text, {'A': 'B', 'B': 'C'})
+
+    assert renamed == 2
+    assert contest_results(text) == {'C': 1}
+
+
+def test_rename_and_remove_in_one_pass():
+    text = election_json({'Allegany': {'votes': 1}, 'Breckenridge': {'votes': 2}, 'Adair': {'votes': 3}})
+
+    text, renamed, removed = rewrite_result_keys(text, {'Breckenridge': 'Breckinridge'}, remove=['Allegany'])
+
+    assert (renamed, removed) == (1, 1)
+    assert list(contest_results(text).items()) == [('Adair', {'votes': 3}), ('Breckinridge', {'votes': 2})]
+
+
+def test_unchanged_text_is_returned_as_is():
+    text = election_json({'Adair': {'votes': 2}})
+
+    assert rewrite_result_keys(text, {'LARU': 'Larue'}) == (text, 0, 0)
+
+
+@pytest.mark.parametrize('use_msgspec', [False, True])
+def test_iter_county_margins_defaults_missing_and_null_fields(tmp_path, monkeypatch, use_msgspec):
+    if use_msgspec:
+        pytest.importorskip('msgspec')
+    else:
+        monkeypatch.setattr(ky_data, 'msgspec', None)
+    # Run from an empty directory so the pickle sidecar is not written next to the real data
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / 'results.json'
+    path.write_text(election_json({
+        'Adair': {'margin_pct': 12.5, 'winner': 'REP', 'votes': 10},
+        'Larue': {'margin_pct': None, 'winner': None},
+        'Owsley': {},
+    }))
+
+    assert list(iter_county_margins(str(path))) == [
+        ('2020', 'Adair', 12.5, 'REP'),
+        ('2020', 'Larue', 0, 'UNKNOWN'),
+        ('2020', 'Owsley', 0, 'UNKNOWN'),
+    ]
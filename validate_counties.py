@@ -6,20 +6,17 @@ Handles abbreviations, alternate spellings, etc.
 
 import json
 
+from ky_data import COUNTY_GEOJSON, iter_contest_results, load_election_data, load_json
+
 # Load both files
-with open('data/ky_election_results.json', 'r') as f:
-    election_data = json.load(f)
+election_data = load_election_data()
 
-with open('data/tl_2020_21_county20/tl_2020_21_county20.geojson', 'r') as f:
-    geojson_data = json.load(f)
+geojson_data = load_json(COUNTY_GEOJSON)
 
 # Extract county names from both sources
 election_counties = set()
-for year in election_data['results_by_year'].values():
-    for office in year.values():
-        for contest in office.values():
-            if 'results' in contest:
-                election_counties.update(contest['results'].keys())
+for _, _, _, contest_results in iter_contest_results(election_data):
+    election_counties.update(contest_results.keys())
 
 geojson_counties = set()
 for feature in geojson_data['features']: